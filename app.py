@@ -4,6 +4,7 @@ import json
 import base64
 import zipfile
 import tempfile
+import threading
 from io import BytesIO
 from datetime import datetime
 
@@ -12,7 +13,8 @@ from flask_cors import CORS
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from circuit_model import OntologyBuilderUnified, simulate_circuit
 from constants import COMPONENT_CONSTANTS
@@ -135,6 +137,12 @@ CORS(app)
 # Initialize circuit model with constants
 circuit_builder = OntologyBuilderUnified(COMPONENT_CONSTANTS)
 
+# The /simulate plot is drawn on one long-lived figure, cleared per request;
+# the lock keeps concurrent requests off it.
+_PLOT_FIGURE = Figure(figsize=(10, 6))
+FigureCanvasAgg(_PLOT_FIGURE)
+_PLOT_LOCK = threading.Lock()
+
 @app.route('/')
 def loading():
     """Main simulator page with drag-and-drop interface"""
@@ -469,44 +477,47 @@ def simulate():
         # Generate equation representations
         equations = generate_equation_display(builder, result)
         
-        # Generate plot
-        plt.figure(figsize=(10, 6))
+        # Generate plot on the shared figure
+        with _PLOT_LOCK:
+            fig = _PLOT_FIGURE
+            fig.clear()
+            ax = fig.add_subplot()
         
-        if 'time_series' in result and result['time_series']:
-            times = result['time_series']['time']
+            if 'time_series' in result and result['time_series']:
+                times = result['time_series']['time']
             
-            for protein, concentrations in result['time_series'].items():
-                if protein != 'time':
-                    plt.plot(times, concentrations, label=protein, linewidth=2)
+                for protein, concentrations in result['time_series'].items():
+                    if protein != 'time':
+                        ax.plot(times, concentrations, label=protein, linewidth=2)
             
-            plt.xlabel('Time (hours)')
-            plt.ylabel('Protein Concentration (μM)')
-            plt.title('Genetic Circuit Dynamics')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
+                ax.set_xlabel('Time (hours)')
+                ax.set_ylabel('Protein Concentration (μM)')
+                ax.set_title('Genetic Circuit Dynamics')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
             
-        else:
-            # Create summary plot if no time series
-            circuits = result.get('circuits', [])
-            if circuits:
-                circuit_names = [f"Circuit {i+1}" for i in range(len(circuits))]
-                component_counts = [len(c.get('components', [])) for c in circuits]
-                
-                plt.bar(circuit_names, component_counts, color=['#FF6B6B', '#4ECDC4', '#FFD166', '#06D6A0'][:len(circuits)])
-                plt.xlabel('Circuits')
-                plt.ylabel('Number of Components')
-                plt.title('Circuit Composition')
             else:
-                plt.text(0.5, 0.5, 'No valid circuits detected', 
-                        ha='center', va='center', transform=plt.gca().transAxes)
-                plt.title('Circuit Analysis Results')
+                # Create summary plot if no time series
+                circuits = result.get('circuits', [])
+                if circuits:
+                    circuit_names = [f"Circuit {i+1}" for i in range(len(circuits))]
+                    component_counts = [len(c.get('components', [])) for c in circuits]
+                
+                    ax.bar(circuit_names, component_counts, color=['#FF6B6B', '#4ECDC4', '#FFD166', '#06D6A0'][:len(circuits)])
+                    ax.set_xlabel('Circuits')
+                    ax.set_ylabel('Number of Components')
+                    ax.set_title('Circuit Composition')
+                else:
+                    ax.text(0.5, 0.5, 'No valid circuits detected', 
+                            ha='center', va='center', transform=ax.transAxes)
+                    ax.set_title('Circuit Analysis Results')
         
-        # Convert plot to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        plot_data = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
+            # Convert plot to base64 - one tight_layout pass and a direct Agg PNG encode
+            # at screen resolution, instead of savefig's bbox_inches='tight' re-render
+            buffer = BytesIO()
+            fig.tight_layout()
+            fig.canvas.print_png(buffer)
+            plot_data = base64.b64encode(buffer.getvalue()).decode()
         
         # Prepare detailed response
         response_data = {
@@ -1,110 +1,194 @@
 import re
+import sys
 import json
+import bisect
 import base64
+import hashlib
 import numpy as np
+from scipy.integrate import odeint
 from io import BytesIO
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict, OrderedDict
+from functools import lru_cache, partial
+from itertools import chain
 import logging
+import threading
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+logger = logging.getLogger(__name__)
+
+# Simulation plots are drawn on one long-lived figure and rendered straight
+# through its Agg canvas; the lock keeps concurrent requests off the shared axes.
+_SIM_FIGURE = Figure(figsize=(10, 6), dpi=100, layout='tight')
+FigureCanvasAgg(_SIM_FIGURE)
+_SIM_AX = _SIM_FIGURE.add_subplot()
+_SIM_PLOT_LOCK = threading.Lock()
+
+
+def _figure_to_base64(fig: Figure) -> str:
+    """Encode a figure as a base64 PNG string for web display"""
+    buffer = BytesIO()
+    fig.canvas.print_png(buffer)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+# Solved simulations keyed by circuit definition; the UI often re-submits an
+# unchanged board, so repeats skip the ODE solve and plot rendering entirely.
+_SIM_CACHE_SIZE = 64
+_SIM_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_SIM_CACHE_LOCK = threading.Lock()
+
+
+def _simulation_cache_key(circuits: List[Dict[str, Any]], regulations: List[Dict[str, Any]],
+                          t_end: float, time_points: int) -> bytes:
+    payload = json.dumps({
+        "circuits": circuits,
+        "regulations": regulations,
+        "t_end": t_end,
+        "time_points": time_points
+    }, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _simulation_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    with _SIM_CACHE_LOCK:
+        sim_data = _SIM_CACHE.get(key)
+        if sim_data is not None:
+            _SIM_CACHE.move_to_end(key)
+        return sim_data
+
+
+def _simulation_cache_put(key: bytes, sim_data: Dict[str, Any]):
+    with _SIM_CACHE_LOCK:
+        _SIM_CACHE[key] = sim_data
+        _SIM_CACHE.move_to_end(key)
+        while len(_SIM_CACHE) > _SIM_CACHE_SIZE:
+            _SIM_CACHE.popitem(last=False)
+
+# Hardware line patterns, e.g. "MUX A, Channel 0:  ['promoter_1'] strength=norm"
+_COMP_RE = re.compile(r"\['([^']+)'\]")
+_STRENGTH_RE = re.compile(r"strength=(\w+)")
+_MUX_RE = re.compile(r"MUX\s+([A-Z]),\s+Channel\s+(\d+):")
+# Whole canonical line in one scan: MUX letter, channel, component, optional strength
+_LINE_RE = re.compile(r"MUX\s+([A-Z]),\s+Channel\s+(\d+):\s*\['([^']+)'\](?:.*?strength=(\w+))?")
+
+# Component type by the label's first "_"-separated token, and the regulator kinds
+_TYPE_BY_PREFIX = {"promoter": "promoter", "rbs": "rbs", "cds": "cds", "terminator": "terminator"}
+_REGULATOR_SET = frozenset({"activator", "repressor", "inducer", "inhibitor"})
+_RBS_CDS_SET = frozenset({"rbs", "cds"})
+# Runs of multiple RBS followed by multiple CDS in an "r"/"c" type string
+_INVALID_RBS_RE = re.compile(r"(r{2,})(c{2,})")
+
+def _classify(lc: str, parts: List[str]) -> str:
+    """Infer the component type from a lowercased label and its "_"-split parts"""
+    comp_type = _TYPE_BY_PREFIX.get(parts[0])
+    if comp_type is not None:
+        return comp_type
+    # Prefix glued to the rest of the label, e.g. "cds2"
+    for prefix, comp_type in _TYPE_BY_PREFIX.items():
+        if lc.startswith(prefix):
+            return comp_type
+    
+    # Check for regulator patterns: activator_start_2, repressor_end_3, etc.
+    # Handle both formats: "repressor_start_2" and "repressor_start2"
+    if parts[0] in _REGULATOR_SET and len(parts) >= 2 and parts[1].startswith(("start", "end")):
+        return sys.intern(parts[0])
+    return "misc"
+
+@lru_cache(maxsize=2048)
+def _parse_label(label: str) -> Tuple[str, Optional[str], Optional[str], bool]:
+    """Split a label into (type, position, reg_key, is_floating); labels repeat so results are memoized"""
+    lc = label.lower()
+    parts = lc.split("_")
+    comp_type = _classify(lc, parts)
+    if comp_type not in _REGULATOR_SET:
+        return comp_type, None, None, False
+
+    is_floating = label.startswith("floating_")
+    # Extract position from label like "repressor_start_2" or "repressor_start2"
+    position_part = parts[1]
+    # Gene number is separate in "repressor_start_2", attached to the position in "repressor_start2"
+    gene_part = parts[2] if len(parts) >= 3 else ""
+    
+    # Extract position
+    if position_part.startswith("start"):
+        position = "start"
+        if not gene_part:  # Extract from combined format
+            gene_part = position_part[len("start"):]
+    else:
+        position = "end"
+        if not gene_part:  # Extract from combined format
+            gene_part = position_part[len("end"):]
+        
+    # Create regulator key
+    reg_key = f"{parts[0]}_{gene_part}" if gene_part else parts[0]
+    return comp_type, position, reg_key, is_floating
+
+# Parameters filled from constants for each component type, with defaults
+_PARAM_SCHEMA = {
+    "promoter": (("strength", 1.0), ("binding_affinity", 0.1)),
+    "rbs": (("efficiency", 1.0), ("translation_rate", 5.0)),
+    "terminator": (("efficiency", 0.99),),
+    "cds": (("translation_rate", 5.0), ("degradation_rate", 0.1),
+            ("init_conc", 0.01), ("max_expression", 100.0)),
+}
+
+# Strength setting -> index into the default regulation parameter tables
+_STRENGTH_CODES = {"weak": 0, "norm": 1, "strong": 2}
+# Default (K, n) per strength code; normal repression uses the classic
+# repressilator range (Kr = 0.35) for oscillation
+_REPRESSOR_DEFAULTS = ((0.5, 2), (0.35, 2), (0.15, 4))
+_ACTIVATOR_DEFAULTS = ((0.6, 2), (0.4, 2), (0.2, 4))
+
+# MUX letters number their 16-channel banks from "A"
+_ORD_A = ord('A')
 
 class Component:
     """Light-weight representation for any parsed component line."""
+
+    __slots__ = ("label", "type", "position", "reg_key", "is_floating", "channel", "mux_chr",
+                 "global_idx", "id", "strength", "strength_code", "constants", "is_regulator",
+                 "parameters", "circuit_name", "_dict")
     
     def __init__(self, raw_label: str, channel: int, mux_chr: str, constants: Dict[str, Any], strength: str = 'norm'):
         self.label = raw_label.strip()
-        self.type = self._infer_type(self.label)
+        self.type, self.position, self.reg_key, self.is_floating = _parse_label(self.label)
         self.channel = channel
         self.mux_chr = mux_chr
-        self.global_idx = (ord(mux_chr) - ord('A')) * 16 + channel
+        self.global_idx = (ord(mux_chr) - _ORD_A) * 16 + channel
         self.id = f"{self.type}_{mux_chr}{channel}"
         self.strength = strength  # Store strength parameter
+        self.strength_code = _STRENGTH_CODES.get(strength, 1)  # Unknown strengths count as normal
         
         # Flat constants for this component/regulator
         self.constants = constants.get(self.label, {})
         
-        # Regulator helpers
-        self.is_regulator = self.type in ("activator", "repressor", "inducer", "inhibitor")
-        if self.is_regulator:
-            self.is_floating = self.label.startswith("floating_")
-            # Extract position from label like "repressor_start_2" or "repressor_start2"
-            parts = self.label.lower().split("_")
-            if len(parts) >= 2:
-                # Handle both formats: "repressor_start_2" and "repressor_start2"
-                if len(parts) >= 3:
-                    # Format: repressor_start_2 (gene number is separate)
-                    position_part = parts[1]
-                    gene_part = parts[2]
-                else:
-                    # Format: repressor_start2 (gene number attached to position)
-                    position_part = parts[1]
-                    gene_part = ""
-                
-                # Extract position
-                if position_part.startswith("start"):
-                    self.position = "start"
-                    if not gene_part:  # Extract from combined format
-                        gene_part = position_part[len("start"):]
-                elif position_part.startswith("end"):
-                    self.position = "end"
-                    if not gene_part:  # Extract from combined format
-                        gene_part = position_part[len("end"):]
-                else:
-                    self.position = None
-                    
-                # Create regulator key
-                if self.position and gene_part:
-                    self.reg_key = f"{parts[0]}_{gene_part}"
-                elif self.position:
-                    self.reg_key = f"{parts[0]}"
-                else:
-                    self.reg_key = None
-            else:
-                self.position = None
-                self.reg_key = None
-        else:
-            self.is_floating = False
-            self.position = None
-            self.reg_key = None
+        # Regulator helpers (position/reg_key/is_floating come from _parse_label)
+        self.is_regulator = self.type in _REGULATOR_SET
         
         # Will be filled in by builder
         self.parameters: Dict[str, Any] = {}
         self.circuit_name: Optional[str] = None
+        self._dict: Optional[Dict[str, Any]] = None
 
-    @staticmethod
-    def _infer_type(label: str) -> str:
-        lc = label.lower()
-        if lc.startswith("promoter"):
-            return "promoter"
-        if lc.startswith("rbs"):
-            return "rbs"
-        if lc.startswith("cds"):
-            return "cds"
-        if lc.startswith("terminator"):
-            return "terminator"
-        
-        # Check for regulator patterns: activator_start_2, repressor_end_3, etc.
-        parts = lc.split("_")
-        if len(parts) >= 2:
-            reg_type = parts[0]
-            position_part = parts[1]
-            
-            # Handle both formats: "repressor_start_2" and "repressor_start2"
-            if position_part.startswith("start") or position_part.startswith("end"):
-                position = "start" if position_part.startswith("start") else "end"
-                if reg_type in ("activator", "repressor", "inducer", "inhibitor"):
-                    return reg_type
-        return "misc"
+    @property
+    def _cached_dict(self) -> Dict[str, Any]:
+        # Built once and shared; "parameters" is the live dict so later
+        # parameter assignment is still reflected.
+        if self._dict is None:
+            self._dict = {
+                "id": self.id,
+                "name": self.label,
+                "type": self.type,
+                "parameters": self.parameters
+            }
+        return self._dict
 
     def to_dict(self):
-        return {
-            "id": self.id,
-            "name": self.label,
-            "type": self.type,
-            "parameters": self.parameters
-        }
+        return dict(self._cached_dict)
 
 class OntologyBuilderUnified:
     """Enhanced ontology builder from Version 15.3 with comprehensive circuit analysis"""
@@ -118,13 +202,16 @@ class OntologyBuilderUnified:
         self.valid_comp_ids: set[str] = set()
 
         # Regulator registry
-        self.regulators: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            "starts": [], "ends": [], "type": None, "is_floating": False
-        })
+        self.regulators: Dict[str, Dict[str, Any]] = {}
         self.regulations: List[Dict[str, Any]] = []
         self.regulator_issues: List[Dict[str, str]] = []
         self.unpaired_regulators: List[Dict[str, str]] = []
 
+        # Lookup indexes for regulation building (filled in build())
+        self._prev_non_reg: Dict[Component, Optional[Component]] = {}
+        self._circuit_cds: Dict[str, Tuple[List[int], List[int], List[str]]] = {}
+        self._items_by_label: Dict[str, List[Component]] = defaultdict(list)
+
         # Extras & misplaced
         self.extra_components_found = {
             "within_valid_circuits": [],
@@ -135,26 +222,11 @@ class OntologyBuilderUnified:
     def parse_text_file(self, lines: List[str]):
         """Parse component lines in hardware txt file format"""
         self.items = []
+        self._items_by_label = defaultdict(list)
         
-        def extract_component(raw: str):
-            # Extract component name from ['component_name']
-            m = re.search(r"\['([^']+)'\]", raw)
-            return m.group(1) if m else None
-        
-        def extract_strength(raw: str):
-            # Extract strength from strength=value
-            m = re.search(r"strength=(\w+)", raw)
-            return m.group(1) if m else 'norm'
-        
-        def extract_mux_channel(raw: str):
-            # Extract MUX and Channel from "MUX A, Channel 0: ['component']"
-            m = re.search(r"MUX\s+([A-Z]),\s+Channel\s+(\d+):", raw)
-            if m:
-                return m.group(1), int(m.group(2))
-            return None, None
-
         in_circ = False
         has_cds = False
+        mux_counter = 0  # components parsed so far, used as the fallback hardware slot
 
         for raw in lines:
             raw = raw.strip()
@@ -165,24 +237,34 @@ class OntologyBuilderUnified:
                 has_cds = False
                 continue
                 
-            lbl = extract_component(raw)
-            if lbl is None:
-                # Blank or unrecognized → circuit break
-                self.items.append(None)
-                in_circ = False
-                has_cds = False
-                continue
+            m = _LINE_RE.search(raw)
+            if m:
+                # Canonical "MUX A, Channel 0:  ['comp'] strength=..." line, parsed in one pass
+                mux_letter, channel, lbl = m.group(1), int(m.group(2)), m.group(3)
+                strength = m.group(4) or 'norm'
+            else:
+                # Extract component name from ['component_name']
+                m = _COMP_RE.search(raw)
+                if m is None:
+                    # Blank or unrecognized → circuit break
+                    self.items.append(None)
+                    in_circ = False
+                    has_cds = False
+                    continue
+                lbl = m.group(1)
+
+                # Extract strength from strength=value
+                m = _STRENGTH_RE.search(raw)
+                strength = m.group(1) if m else 'norm'
 
-            # Extract strength info
-            strength = extract_strength(raw)
+                # Extract MUX/Channel info for proper hardware indexing
+                m = _MUX_RE.search(raw)
+                mux_letter, channel = (m.group(1), int(m.group(2))) if m else (None, None)
 
-            # Extract MUX/Channel info for proper hardware indexing
-            mux_letter, channel = extract_mux_channel(raw)
             if mux_letter and channel is not None:
                 comp = Component(lbl, channel, mux_letter, self.constants, strength)
             else:
                 # Fallback for simple format without MUX/Channel
-                mux_counter = len([x for x in self.items if x is not None])
                 comp = Component(lbl, mux_counter % 16, chr(65 + mux_counter // 16), self.constants, strength)
 
             # Break circuit on new promoter after seeing a CDS
@@ -192,13 +274,18 @@ class OntologyBuilderUnified:
                 has_cds = False
 
             self.items.append(comp)
+            self._items_by_label[comp.label].append(comp)
+            mux_counter += 1
             in_circ = True
             if comp.type == "cds":
                 has_cds = True
 
             # Register regulator starts/ends
             if comp.is_regulator and comp.position:
-                rec = self.regulators[comp.reg_key]
+                rec = self.regulators.get(comp.reg_key)
+                if rec is None:
+                    rec = {"starts": [], "ends": [], "type": None, "is_floating": False}
+                    self.regulators[comp.reg_key] = rec
                 rec["type"] = comp.type
                 rec["is_floating"] = comp.is_floating
                 rec[f"{comp.position}s"].append(comp)
@@ -206,7 +293,7 @@ class OntologyBuilderUnified:
     def build(self):
         """Build circuits and analyze regulatory networks"""
         block: List[Component] = []
-        for itm in self.items + [None]:
+        for itm in chain(self.items, (None,)):
             if itm is None:
                 if block:
                     self._finalize_block(block)
@@ -215,6 +302,7 @@ class OntologyBuilderUnified:
             block.append(itm)
 
         self._detect_unpaired_regulators()
+        self._index_components()
         self._build_regulations()
         self._add_constitutive_regulations()
         self._detect_extras_outside()
@@ -222,27 +310,17 @@ class OntologyBuilderUnified:
     def _finalize_block(self, comps: List[Component]):
         """Finalize a circuit block with enhanced parameter assignment"""
         # Fill comp.parameters from flat constants
+        debug = logger.isEnabledFor(logging.DEBUG)
         for comp in comps:
             params = self.constants.get(comp.label, {})
-            print(f"[DEBUG] Assigning parameters to {comp.type} '{comp.label}': found {len(params)} parameters: {params}")
+            if debug:
+                logger.debug("Assigning parameters to %s '%s': found %d parameters: %s",
+                             comp.type, comp.label, len(params), params)
             
-            if comp.type == "promoter":
-                comp.parameters["strength"] = params.get("strength", 1.0)
-                comp.parameters["binding_affinity"] = params.get("binding_affinity", 0.1)
-                print(f"  - Promoter {comp.label}: strength = {comp.parameters['strength']}")
-            elif comp.type == "rbs":
-                comp.parameters["efficiency"] = params.get("efficiency", 1.0)
-                comp.parameters["translation_rate"] = params.get("translation_rate", 5.0)
-                print(f"  - RBS {comp.label}: efficiency = {comp.parameters['efficiency']}")
-            elif comp.type == "terminator":
-                comp.parameters["efficiency"] = params.get("efficiency", 0.99)
-                print(f"  - Terminator {comp.label}: efficiency = {comp.parameters['efficiency']}")
-            elif comp.type == "cds":
-                comp.parameters["translation_rate"] = params.get("translation_rate", 5.0)
-                comp.parameters["degradation_rate"] = params.get("degradation_rate", 0.1)
-                comp.parameters["init_conc"] = params.get("init_conc", 0.01)
-                comp.parameters["max_expression"] = params.get("max_expression", 100.0)
-                print(f"  - CDS {comp.label}: translation_rate = {comp.parameters['translation_rate']}, degradation_rate = {comp.parameters['degradation_rate']}")
+            for key, default in _PARAM_SCHEMA.get(comp.type, ()):
+                comp.parameters[key] = params.get(key, default)
+            if debug and comp.parameters:
+                logger.debug("  - %s %s: %s", comp.type, comp.label, comp.parameters)
 
         # Skip if no CDS
         if not any(c.type == "cds" for c in comps):
@@ -259,18 +337,20 @@ class OntologyBuilderUnified:
         extras = []
         misplaced = []
         type_counts = defaultdict(int)
+        by_type = defaultdict(list)
 
         for comp in comps:
             t = comp.type
             type_counts[t] += 1
+            by_type[t].append(comp)
 
             # Enhanced misplacement detection
             if t == "promoter" and type_counts["cds"] > 0:
-                misplaced.append({**comp.to_dict(), "reason": "Promoter after CDS"})
+                misplaced.append({**comp._cached_dict, "reason": "Promoter after CDS"})
             elif t == "rbs" and type_counts["cds"] > 0 and type_counts["rbs"] == 1:
-                misplaced.append({**comp.to_dict(), "reason": "First RBS after CDS"})
+                misplaced.append({**comp._cached_dict, "reason": "First RBS after CDS"})
             elif t == "terminator" and type_counts["cds"] == 0:
-                misplaced.append({**comp.to_dict(), "reason": "Terminator before CDS"})
+                misplaced.append({**comp._cached_dict, "reason": "Terminator before CDS"})
 
         # After processing all components, detect extras
         cds_count = type_counts["cds"]
@@ -279,19 +359,19 @@ class OntologyBuilderUnified:
         # Add extra components based on final counts
         if type_counts["promoter"] > 1:
             # Mark all promoters beyond the first as extra
-            promoter_comps = [c for c in comps if c.type == "promoter"]
+            promoter_comps = by_type["promoter"]
             for i in range(1, len(promoter_comps)):
-                extras.append({**promoter_comps[i].to_dict(), "reason": "Extra promoter"})
+                extras.append({**promoter_comps[i]._cached_dict, "reason": "Extra promoter"})
                 
         if type_counts["terminator"] > 1:
             # Mark all terminators beyond the first as extra
-            terminator_comps = [c for c in comps if c.type == "terminator"]
+            terminator_comps = by_type["terminator"]
             for i in range(1, len(terminator_comps)):
-                extras.append({**terminator_comps[i].to_dict(), "reason": "Extra terminator"})
+                extras.append({**terminator_comps[i]._cached_dict, "reason": "Extra terminator"})
                 
         # Enhanced RBS sequence validation
-        rbs_comps = [c for c in comps if c.type == "rbs"]
-        cds_comps = [c for c in comps if c.type == "cds"]
+        rbs_comps = by_type["rbs"]
+        cds_comps = by_type["cds"]
         
         if rbs_count > 0 and cds_count > 0:
             # Validate RBS sequence patterns
@@ -301,7 +381,7 @@ class OntologyBuilderUnified:
             # Fallback: if more RBS than CDS, mark excess as extra
             excess_count = rbs_count - cds_count
             for i in range(rbs_count - excess_count, rbs_count):
-                extras.append({**rbs_comps[i].to_dict(), "reason": f"Extra RBS (more RBS than CDS)"})
+                extras.append({**rbs_comps[i]._cached_dict, "reason": f"Extra RBS (more RBS than CDS)"})
 
         # Store results
         self.extra_components_found["within_valid_circuits"].extend(extras)
@@ -309,9 +389,7 @@ class OntologyBuilderUnified:
 
         # Detect incomplete circuits and generate fallback parameters
         fallback_by_cds = {}
-        cds_components = [c for c in comps if c.type == "cds"]
-        
-        for cds_comp in cds_components:
+        for cds_comp in cds_comps:
             fallbacks = {}
             
             # Check for missing promoter
@@ -335,7 +413,7 @@ class OntologyBuilderUnified:
         # Create circuit dict
         circuit_dict = {
             "name": name,
-            "components": [c.to_dict() for c in comps],
+            "components": [c._cached_dict for c in comps],
             "extras": extras,
             "misplaced": misplaced,
             "component_counts": dict(type_counts),
@@ -355,48 +433,24 @@ class OntologyBuilderUnified:
         """
         extras = []
         
-        # Get sequence of RBS and CDS components in order
-        rbs_cds_sequence = [comp for comp in comps if comp.type in ["rbs", "cds"]]
-        
-        if len(rbs_cds_sequence) < 2:
+        # The invalid pattern needs at least two RBS and two CDS in the block
+        if len(rbs_comps) < 2 or len(cds_comps) < 2:
             return extras
+        
+        # Get sequence of RBS and CDS components in order
+        rbs_cds_sequence = [comp for comp in comps if comp.type in _RBS_CDS_SET]
             
         # Create type sequence string for pattern analysis
-        types_sequence = [comp.type for comp in rbs_cds_sequence]
-        types_string = "".join(t[0] for t in types_sequence)  # 'r' for rbs, 'c' for cds
+        types_string = "".join(comp.type[0] for comp in rbs_cds_sequence)  # 'r' for rbs, 'c' for cds
         
-        # Find runs of consecutive RBS followed by runs of consecutive CDS
-        i = 0
-        while i < len(types_sequence):
-            if types_sequence[i] == "rbs":
-                # Count consecutive RBS
-                rbs_start = i
-                while i < len(types_sequence) and types_sequence[i] == "rbs":
-                    i += 1
-                rbs_count = i - rbs_start
-                
-                # Check if followed by consecutive CDS
-                if i < len(types_sequence) and types_sequence[i] == "cds":
-                    cds_start = i
-                    while i < len(types_sequence) and types_sequence[i] == "cds":
-                        i += 1
-                    cds_count = i - cds_start
-                    
-                    # Invalid pattern: multiple RBS before multiple CDS
-                    if rbs_count > 1 and cds_count > 1:
-                        # Mark all RBS except the first one as extra
-                        for j in range(rbs_start + 1, rbs_start + rbs_count):
-                            extra_rbs_comp = rbs_cds_sequence[j]
-                            extras.append({
-                                **extra_rbs_comp.to_dict(), 
-                                "reason": "Invalid RBS sequence (multiple RBS before multiple CDS)"
-                            })
-                else:
-                    # Single step if not followed by CDS
-                    if i == rbs_start:  # Avoid infinite loop
-                        i += 1
-            else:
-                i += 1
+        # Invalid pattern: a run of multiple RBS directly followed by a run of multiple CDS
+        for m in _INVALID_RBS_RE.finditer(types_string):
+            # Mark all RBS except the first one as extra
+            for j in range(m.start(1) + 1, m.end(1)):
+                extras.append({
+                    **rbs_cds_sequence[j]._cached_dict,
+                    "reason": "Invalid RBS sequence (multiple RBS before multiple CDS)"
+                })
         
         return extras
 
@@ -424,35 +478,50 @@ class OntologyBuilderUnified:
                     "hint": hint
                 })
 
-    def _nearest_prev_non_reg(self, comp: Component):
-        """Find nearest previous non-regulator component"""
-        for i in range(len(self.items) - 1, -1, -1):
-            item = self.items[i]
-            if (isinstance(item, Component) and 
-                item.global_idx < comp.global_idx and 
-                not item.is_regulator):
-                return item
-        return None
+    def _index_components(self):
+        """Precompute regulation lookups so _build_regulations needs no scans"""
+        # Nearest previous non-regulator for every regulator, merged in one sweep: of the
+        # non-regulators with a smaller global index, the one listed last in the file
+        # (MUX lines may be out of order, so that is not always the largest index)
+        comps = [(pos, item) for pos, item in enumerate(self.items) if isinstance(item, Component)]
+        non_regs = sorted(((c.global_idx, pos, c) for pos, c in comps if not c.is_regulator),
+                          key=lambda e: e[0])
+        regulators = sorted((c for _, c in comps if c.is_regulator), key=lambda c: c.global_idx)
+        self._prev_non_reg = {}
+        j, prev, prev_pos = 0, None, -1
+        for reg in regulators:
+            while j < len(non_regs) and non_regs[j][0] < reg.global_idx:
+                if non_regs[j][1] > prev_pos:
+                    prev_pos, prev = non_regs[j][1], non_regs[j][2]
+                j += 1
+            self._prev_non_reg[reg] = prev
 
-    def _downstream_cds(self, circuit_name: str, idx_threshold: int) -> List[str]:
-        """Find CDS components downstream of given index in circuit"""
-        names = []
+        # Per-circuit CDS sorted by global index, with their position in the circuit so
+        # downstream queries can bisect yet still answer in listed order
+        self._circuit_cds = {}
         for circ in self.circuits:
-            if circ["name"] != circuit_name:
-                continue
+            if circ["name"] in self._circuit_cds:
+                continue  # lookups by name resolve to the first circuit
+            cds_objs = []
             for comp_dict in circ["components"]:
                 if comp_dict["type"] == "cds":
-                    # Find the actual Component object
-                    obj = next(
-                        (item for item in self.items
-                         if isinstance(item, Component)
-                         and item.label == comp_dict["name"]),
-                        None
-                    )
-                    if obj and obj.global_idx > idx_threshold:
-                        names.append(obj.label)
-            break
-        return names
+                    # Find the actual Component object (first one parsed with this label)
+                    objs = self._items_by_label.get(comp_dict["name"])
+                    if objs:
+                        cds_objs.append(objs[0])
+            cds_sorted = sorted(enumerate(cds_objs), key=lambda e: e[1].global_idx)
+            self._circuit_cds[circ["name"]] = ([c.global_idx for _, c in cds_sorted],
+                                               [pos for pos, _ in cds_sorted],
+                                               [c.label for _, c in cds_sorted])
+
+    def _downstream_cds(self, circuit_name: str, idx_threshold: int) -> List[str]:
+        """Find CDS components downstream of given index in circuit"""
+        cds = self._circuit_cds.get(circuit_name)
+        if cds is None:
+            return []
+        idxs, positions, labels = cds
+        k = bisect.bisect_right(idxs, idx_threshold)
+        return [label for _, label in sorted(zip(positions[k:], labels[k:]))]
 
     def _build_regulations(self):
         """Build regulatory network using your original logic"""
@@ -475,7 +544,7 @@ class OntologyBuilderUnified:
                 continue
 
             for end in ends:
-                prom_prev = self._nearest_prev_non_reg(end)
+                prom_prev = self._prev_non_reg[end]
                 if not prom_prev or prom_prev.type != "promoter":
                     self.regulator_issues.append({
                         "label": end.label,
@@ -496,7 +565,7 @@ class OntologyBuilderUnified:
 
                     # Determine source CDS (or key) for non-floating
                     if not rec["is_floating"]:
-                        src_prev = self._nearest_prev_non_reg(start)
+                        src_prev = self._prev_non_reg[start]
                         if not src_prev or src_prev.type != "cds":
                             self.regulator_issues.append({
                                 "label": start.label,
@@ -519,34 +588,12 @@ class OntologyBuilderUnified:
                         # Within same circuit → self activation/repression
                         kind = self_map.get(rec["type"])
 
-                    # Use consistent default parameters unless strength is specified
-                    # Check if this is a "strong" or "weak" regulation based on component strength
-                    component_strength = getattr(start, 'strength', 'norm')  # Default to normal
-                    
-                    # Define consistent default regulation parameters
+                    # Consistent default (K, n) by the start component's strength;
+                    # lower K = stronger regulation
                     if rec["type"] == "repressor":
-                        if component_strength == "strong":
-                            default_Kr = 0.15  # Strong repression (lower Kr = stronger)
-                            default_n = 4
-                        elif component_strength == "weak":
-                            default_Kr = 0.5   # Weak repression (higher Kr = weaker)
-                            default_n = 2
-                        else:
-                            # Use optimal Kr values for repressilator oscillation (classic range)
-                            regulation_index = len(self.regulations)
-                            kr_values = [0.35, 0.35, 0.35]  # Optimal repression strength for oscillation
-                            default_Kr = kr_values[regulation_index % len(kr_values)]
-                            default_n = 2
+                        default_Kr, default_n = _REPRESSOR_DEFAULTS[start.strength_code]
                     else:  # activator, inducer, inhibitor
-                        if component_strength == "strong":
-                            default_Ka = 0.2
-                            default_n = 4
-                        elif component_strength == "weak":
-                            default_Ka = 0.6
-                            default_n = 2
-                        else:
-                            default_Ka = 0.4   # Consistent normal activation
-                            default_n = 2
+                        default_Ka, default_n = _ACTIVATOR_DEFAULTS[start.strength_code]
                     
                     # Pull any custom constants from the constants file (optional override)
                     base = self.constants.get(start.reg_key, {})
@@ -574,25 +621,24 @@ class OntologyBuilderUnified:
 
     def _add_constitutive_regulations(self):
         """Add constitutive regulations for unregulated CDSs"""
+        regulated_cds = set()
+        for reg in self.regulations:
+            regulated_cds.update(reg.get("affected_cdss", ()))
+
         for circ in self.circuits:
             cds_names = [c["name"] for c in circ["components"] if c["type"] == "cds"]
+
+            # Nearest upstream promoter for the first occurrence of each name, in one pass
+            upstream_prom: Dict[str, Optional[str]] = {}
+            last_prom = None
+            for c in circ["components"]:
+                upstream_prom.setdefault(c["name"], last_prom)
+                if c["type"] == "promoter":
+                    last_prom = c["name"]
             
             for name in cds_names:
-                has_reg = any(
-                    reg for reg in self.regulations
-                    if name in reg.get("affected_cdss", [])
-                )
-                
-                if not has_reg:
-                    # Find nearest upstream promoter for this CDS
-                    cds_idx = next(i for i, c in enumerate(circ["components"]) if c["name"] == name)
-                    prom_name = None
-                    
-                    for i in range(cds_idx - 1, -1, -1):
-                        if circ["components"][i]["type"] == "promoter":
-                            prom_name = circ["components"][i]["name"]
-                            break
-                    
+                if name not in regulated_cds:
+                    prom_name = upstream_prom[name]
                     if prom_name:
                         self.regulations.append({
                             "type": "constitutive",
@@ -604,6 +650,7 @@ class OntologyBuilderUnified:
                             },
                             "affected_cdss": [name]
                         })
+                        regulated_cds.add(name)
 
     def _detect_extras_outside(self):
         """Detect components outside valid circuits"""
@@ -613,19 +660,423 @@ class OntologyBuilderUnified:
         for item in self.items:
             if item is not None and item.id in outside_ids:
                 self.extra_components_found["outside_of_valid_circuits"].append({
-                    **item.to_dict(),
+                    **item._cached_dict,
                     "reason": "Outside valid circuit"
                 })
 
-def simulate_circuit(builder: OntologyBuilderUnified) -> Dict[str, Any]:
-    """Enhanced circuit simulation using your original equation building logic from Version 15.2"""
-    import matplotlib
-    matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
-    import numpy as np
-    from scipy.integrate import odeint
-    from collections import defaultdict
+@lru_cache(maxsize=1024)
+def _cds_display_key(name: str) -> Tuple[str, int]:
+    """Display letter and gene number for a CDS name (cds_1 -> A, 1; cds_b -> B, 2); names repeat so results are memoized"""
+    if "cds" in name:
+        # Handle both formats: cds_2 and cds2
+        if "_" in name:
+            gene_part = name.split("_")[-1]  # Get last part after underscore
+        else:
+            gene_part = name.replace("cds", "")  # Remove cds prefix
+        
+        try:
+            # Convert gene letter/number to display letter
+            if gene_part.isdigit():
+                return chr(65 + int(gene_part) - 1), int(gene_part)  # 1->A, 2->B, etc.
+            elif gene_part.isalpha():
+                return gene_part.upper(), ord(gene_part.upper()) - _ORD_A + 1  # a->A, b->B, etc.
+        except (ValueError, IndexError):
+            pass
+    return "A", 1
+
+def _hill_rhs(p, t, k0, kprod, degr, reg_target, reg_src_idx, reg_Kn, reg_n, reg_is_rep):
+    """dp/dt = k0 + kprod * prod(Hill factors) - degr * p over flattened protein-sourced regulations
+
+    Constant (floating regulator) factors are folded into ``kprod`` and ``reg_Kn`` holds the
+    precomputed K**n; ``reg_n`` is a scalar when every regulation shares one Hill coefficient.
+    ``p`` may hold B stacked copies of the system (length B * N) to solve a batch at once,
+    with ``k0``/``kprod``/``degr`` either shared (N,) or per copy (B, N).
+    """
+    p = p.reshape(-1, k0.shape[-1])
+    f = np.ones_like(p)
+    if reg_target.size:
+        vn = p[:, reg_src_idx] ** reg_n
+        np.multiply.at(f, (slice(None), reg_target), np.where(reg_is_rep, reg_Kn, vn) / (reg_Kn + vn))
+    # Reuse f as the output buffer rather than allocating a temporary per operator
+    f *= kprod
+    f += k0
+    f -= degr * p
+    return f.ravel()
+
+def _hill_rhs_csr(p, t, k0, kprod, degr, row_ptr, src_idx, Kn, n, is_rep):
+    """Single-system _hill_rhs over a target-grouped (CSR) regulation table of plain lists
+
+    Regulations acting on protein i are ``row_ptr[i]:row_ptr[i + 1]``; for the handful of
+    proteins in a circuit, float arithmetic beats per-call numpy dispatch.
+    """
+    pl = p.tolist()
+    dpdt = []
+    for i, p_i in enumerate(pl):
+        f = 1.0
+        for m in range(row_ptr[i], row_ptr[i + 1]):
+            vn = pl[src_idx[m]] ** n[m]
+            f *= (Kn[m] if is_rep[m] else vn) / (Kn[m] + vn)
+        dpdt.append(k0[i] + kprod[i] * f - degr[i] * p_i)
+    return dpdt
+
+def _hill_jac_csr(p, t, k0, kprod, degr, row_ptr, src_idx, Kn, n, is_rep):
+    """Analytic Jacobian of _hill_rhs_csr, J[i, j] = d(dp_i/dt)/dp_j, for odeint's Dfun"""
+    pl = p.tolist()
+    jac = np.diag(np.negative(degr))
+    for i in range(len(pl)):
+        start, end = row_ptr[i], row_ptr[i + 1]
+        if start == end:
+            continue
+        hill, dhill = [], []
+        for m in range(start, end):
+            val = pl[src_idx[m]]
+            vn = val ** n[m]
+            denom = Kn[m] + vn
+            hill.append((Kn[m] if is_rep[m] else vn) / denom)
+            # d(hill)/d(val) = ±n * K^n * val^(n-1) / (K^n + val^n)^2, negative for repression
+            d = n[m] * Kn[m] * val ** (n[m] - 1) / (denom * denom)
+            dhill.append(-d if is_rep[m] else d)
+        for k in range(end - start):
+            # Product of the other Hill factors acting on protein i
+            others = 1.0
+            for l, h in enumerate(hill):
+                if l != k:
+                    others *= h
+            jac[i, src_idx[start + k]] += kprod[i] * others * dhill[k]
+    return jac
+
+def _hill_jac_csr_banded(p, t, *csr_args, ml: int, mu: int):
+    """_hill_jac_csr in LSODA banded storage, band[mu + i - j, j] = J[i, j], for odeint's ml/mu mode"""
+    jac = _hill_jac_csr(p, t, *csr_args)
+    n = len(jac)
+    band = np.zeros((ml + mu + 1, n))
+    for d in range(-mu, ml + 1):
+        band[mu + d, max(0, -d):n - max(0, d)] = np.diagonal(jac, -d)
+    return band
+
+def _hill_table(row_ptr, src_idx, Kn, n, is_rep) -> Tuple:
+    """Array form of a CSR regulation table (the tail of _hill_rhs_csr's args) for the vectorized _hill_rhs"""
+    reg_n = np.array(n, dtype=float)
+    # A shared Hill coefficient is passed as a scalar so numpy can use its fast power paths
+    if reg_n.size and np.all(reg_n == reg_n[0]):
+        reg_n = float(reg_n[0])
+    return (
+        np.repeat(np.arange(len(row_ptr) - 1), np.diff(row_ptr)), np.array(src_idx, dtype=np.intp),
+        np.array(Kn, dtype=float), reg_n, np.array(is_rep, dtype=bool)
+    )
+
+def _initial_state(p0, has_regulatory_feedback: bool) -> np.ndarray:
+    """Starting concentrations, replacing an all-zero start with small (symmetry-breaking) values"""
+    p0 = np.array(p0, dtype=float)
+    # any() bails at the first non-zero entry, cheaper than allclose on every call
+    all_zero = not p0.any()
+    if len(p0) >= 3 and all_zero and has_regulatory_feedback:
+        # Apply asymmetry breaking ONLY for repressilator-type systems with regulatory feedback
+        asymmetry_factors = [1.0, 0.1, 0.05]  # First protein starts higher
+        for i in range(len(p0)):
+            if i < len(asymmetry_factors):
+                p0[i] = asymmetry_factors[i]
+            else:
+                p0[i] = 0.01  # Small non-zero value for additional proteins
+    elif len(p0) >= 1 and all_zero:
+        # For constitutive circuits, use equal small starting concentrations for all proteins  
+        for i in range(len(p0)):
+            p0[i] = 0.01  # Equal starting concentration for constitutive circuits
+    return p0
+
+def _circuit_system(builder: OntologyBuilderUnified) -> Dict[str, Any]:
+    """Flatten the builder's CDS species and regulations into the arrays the Hill ODE solves
+
+    ``cds_list`` is empty when no circuit holds a CDS. Otherwise ``csr_args`` is the system
+    passed to _hill_rhs_csr: the per-CDS ``k0``, ``kprod`` (times the constant floating
+    regulator factors in ``const_factor``) and ``degr`` followed by ``regulation_table``,
+    the protein-sourced regulations grouped by target.
+    """
+    # Use your exact logic from the notebook
+    cell = {
+        "circuits": builder.circuits,
+        "regulations": builder.regulations
+    }
+    
+    # Parameters matching your notebook
+    basal_constitutive = 0.01  # k0 for constitutive (no regulators)
+    initial_conc_default = 0.01  # backup initial [protein] for all CDS species
     
+    # Gather CDS entries + display names using your logic
+    cds_list = []
+    display_names = []
+    id2comp = {}
+    id2circ = {}
+    id2base_prom = {}  # CDS ID → its circuit's base promoter strength
+    id2cds_to_rbs = {}  # CDS ID → its circuit's CDS name → RBS name mapping
+    name_to_comp_by_circ = {}  # circuit name → {component name: first component with it}
+    
+    for circ in cell["circuits"]:
+        # Skip circuits marked as non-modelable (if such marking exists)
+        # Default to True if not specified
+        if circ.get("modelable", True) is False:
+            continue
+            
+        comps = circ["components"]
+        
+        # Determine base promoter strength using your logic
+        first_cds_idx = next((i for i, c in enumerate(comps) if c["type"] == "cds"), None)
+        if first_cds_idx is not None:
+            prom_idxs = [i for i, c in enumerate(comps) if c["type"] == "promoter" and i < first_cds_idx]
+            base_prom = comps[max(prom_idxs)]["parameters"].get("strength", 0.0) if prom_idxs else 0.01
+        else:
+            base_prom = 0.01
+        
+        # Build cds_to_rbs mapping like in your notebook
+        cds_to_rbs = {}
+        for i, comp in enumerate(comps):
+            if comp["type"] == "rbs":
+                # Find next CDS after this RBS
+                for j in range(i + 1, len(comps)):
+                    if comps[j]["type"] == "cds":
+                        cds_to_rbs[comps[j]["name"]] = comp["name"]
+                        break
+        
+        name_to_comp = {}
+        for comp in comps:
+            name_to_comp.setdefault(comp["name"], comp)
+        name_to_comp_by_circ[circ["name"]] = name_to_comp
+        
+        # Count CDS components per gene to handle multiple CDS in same gene
+        gene_cds_count = {}
+        for comp in comps:
+            if comp["type"] == "cds":
+                # Extract gene info from component ID (e.g., "cds_A3" -> gene from original placement)
+                comp_id = comp["id"]
+                # Find the gene number from the original component placement
+                gene_num = 1  # default
+                if hasattr(comp, 'gene_number'):
+                    gene_num = comp.gene_number
+                elif 'gene' in comp.get('metadata', {}):
+                    gene_num = comp['metadata']['gene']
+                
+                gene_cds_count[gene_num] = gene_cds_count.get(gene_num, 0) + 1
+        
+        # Track CDS sequence numbers within each gene
+        gene_cds_counters = {}
+        
+        for comp in comps:
+            if comp["type"] != "cds": 
+                continue
+            cds_id = comp["id"]
+            letter, gene_num = _cds_display_key(comp["name"])
+            
+            # Track sequence number for this gene
+            if gene_num not in gene_cds_counters:
+                gene_cds_counters[gene_num] = 0
+            gene_cds_counters[gene_num] += 1
+            sequence_num = gene_cds_counters[gene_num]
+            
+            # Create unique display name for each CDS, even if redundant
+            if gene_cds_count.get(gene_num, 1) > 1:
+                # Multiple CDS in same gene - differentiate by sequence
+                display_name = f"Protein {letter}.{sequence_num}, Gene Circuit {gene_num}"
+            else:
+                # Single CDS in gene
+                display_name = f"Protein {letter}, Gene Circuit {gene_num}"
+            
+            cds_list.append(cds_id)
+            display_names.append(display_name)
+            id2comp[cds_id] = comp
+            id2circ[cds_id] = circ
+            id2base_prom[cds_id] = base_prom
+            id2cds_to_rbs[cds_id] = cds_to_rbs
+
+    if not cds_list:
+        return {'cell': cell, 'cds_list': []}
+    
+    # Build CDS name to ALL indices mapping for regulation lookup
+    cds_name_to_indices = defaultdict(list)
+    for i, cds_id in enumerate(cds_list):
+        comp = id2comp[cds_id]
+        cds_name_to_indices[comp["name"]].append(i)
+    
+    # Group regulations by CDS ID - apply to ALL CDS with matching name
+    debug = logger.isEnabledFor(logging.DEBUG)
+    regs_by_cds = defaultdict(list)
+    if debug:
+        logger.debug("Processing %d regulations", len(cell.get("regulations", [])))
+    for reg in cell.get("regulations", []):
+        if debug:
+            logger.debug("Regulation %s → %s (type: %s)",
+                         reg["source"], reg.get("affected_cdss", []), reg["type"])
+        for tgt_name in reg.get("affected_cdss", []):
+            # Apply regulation to ALL CDS components with this name
+            for i in cds_name_to_indices.get(tgt_name, ()):
+                regs_by_cds[cds_list[i]].append(reg)
+    
+    if debug:
+        logger.debug("CDS mapping: %s", dict(cds_name_to_indices))
+        logger.debug("Regulations by CDS: %s", [(cid, len(regs)) for cid, regs in regs_by_cds.items()])
+    
+    # Build per-CDS parameters using your exact logic
+    cds_params = {}
+    for i, cds_id in enumerate(cds_list):
+        comp = id2comp[cds_id]
+        circ = id2circ[cds_id]
+        base_prom = id2base_prom[cds_id]
+        
+        # RBS efficiency (name-based lookup) using your logic
+        rbs_name = id2cds_to_rbs[cds_id].get(comp["name"])
+        if rbs_name:
+            rbs_comp = name_to_comp_by_circ[circ["name"]].get(rbs_name)
+            base_rbs = rbs_comp["parameters"]["efficiency"] if rbs_comp else 0.01
+        else:
+            base_rbs = 0.01
+        
+        # Fallback & effective rates using your logic
+        fb = circ.get("fallback_by_cds", {}).get(comp["name"], {})
+        prom_s = fb.get("prom_strength", base_prom)
+        rbs_e = fb.get("rbs_efficiency", base_rbs)
+        degr = fb.get("degradation_rate", comp["parameters"]["degradation_rate"])
+        
+        # Numeric parameters matching working notebook - tuned for oscillations
+        kprod = prom_s * rbs_e * 1.0  # Balanced production rate for oscillations
+        k0 = basal_constitutive if not regs_by_cds.get(cds_id) else 0.01
+        
+        cds_params[cds_id] = {
+            "k0": k0,
+            "prom_strength": prom_s,
+            "rbs_eff": rbs_e,
+            "kprod": kprod,
+            "degradation": degr,
+            "initial_conc": comp["parameters"].get("init_conc", initial_conc_default)
+        }
+    
+    # Flatten CDS parameters and regulations into arrays so the RHS runs without dict lookups
+    k0 = np.array([cds_params[cds_id]["k0"] for cds_id in cds_list])
+    kprod = np.array([cds_params[cds_id]["kprod"] for cds_id in cds_list])
+    degr = np.array([cds_params[cds_id]["degradation"] for cds_id in cds_list])
+    const_factor = np.ones(len(cds_list))
+    
+    reg_target, reg_src_idx, reg_K, reg_n, reg_is_rep = [], [], [], [], []
+    for i, cds_id in enumerate(cds_list):
+        for reg in regs_by_cds.get(cds_id, []):
+            typ = reg["type"]
+            if typ == "constitutive":
+                continue  # always "on", contributes a factor of 1
+            
+            pr = reg["parameters"]
+            # Use higher Hill coefficient for sharper response (better for oscillations)
+            n = pr.get("n", 4 if typ in ("self_repression", "self_activation") else 2)
+            
+            # Resolve the regulator: the first CDS with the source name (live protein
+            # concentration), or a constant concentration for floating regulators
+            src_name = reg["source"]
+            if src_name in cds_name_to_indices:
+                src_idx = cds_name_to_indices[src_name][0]
+            elif typ in ("induced_activation", "environmental_repression"):
+                src_idx = -1
+            else:
+                raise ValueError(f"Cannot resolve source {src_name} for regulation type {typ}")
+            
+            if typ in ("transcriptional_activation", "self_activation", "induced_activation"):
+                K, is_rep = pr.get("Ka", 0.2), False  # Lower Ka for stronger activation
+            elif typ in ("transcriptional_repression", "self_repression", "environmental_repression"):
+                K, is_rep = pr.get("Kr", 0.35), True  # Tuned repressilator value as fallback
+            else:
+                continue
+            
+            if src_idx < 0:
+                # Constant concentration → the Hill factor is fixed for the whole solve
+                val = pr.get("concentration", 1.0)
+                hill_val = (K**n if is_rep else val**n) / (K**n + val**n)
+                const_factor[i] *= hill_val
+                continue
+            
+            reg_target.append(i)
+            reg_src_idx.append(src_idx)
+            reg_K.append(K)
+            # Hill coefficients are often ints (defaults, JSON); float ** float skips the
+            # per-call int conversion in the RHS/Jacobian loops, with identical results
+            reg_n.append(float(n))
+            reg_is_rep.append(is_rep)
+    
+    # Regulations were collected in target order, so row i of the CSR table is
+    # the slice row_ptr[i]:row_ptr[i + 1]
+    row_ptr = np.concatenate(([0], np.cumsum(np.bincount(reg_target, minlength=len(cds_list))))).tolist()
+    # K**n is fixed through the solve
+    reg_Kn = [K**n for K, n in zip(reg_K, reg_n)]
+    regulation_table = (row_ptr, reg_src_idx, reg_Kn, reg_n, reg_is_rep)
+    
+    # For repressilator (3+ proteins with regulatory feedback), break symmetry if all concentrations are zero
+    has_regulatory_feedback = any(
+        reg["type"] not in ("constitutive",) 
+        for reg in cell["regulations"]
+    )
+    # Initial conditions - use user parameters or defaults
+    p0 = _initial_state([cds_params[cds_id]["initial_conc"] for cds_id in cds_list], has_regulatory_feedback)
+    
+    return {
+        'cell': cell,
+        'cds_list': cds_list,
+        'display_names': display_names,
+        'id2comp': id2comp,
+        'id2circ': id2circ,
+        'k0': k0,
+        'kprod': kprod,
+        'degr': degr,
+        'const_factor': const_factor,
+        'p0': p0,
+        'reg_target': reg_target,
+        'reg_src_idx': reg_src_idx,
+        'regulation_table': regulation_table,
+        'csr_args': (k0.tolist(), (kprod * const_factor).tolist(), degr.tolist()) + regulation_table,
+        'has_regulatory_feedback': has_regulatory_feedback
+    }
+
+# Per-CDS values (as derived by _circuit_system) a simulate_batch parameter set may replace
+_BATCH_PARAMETERS = ("k0", "kprod", "degradation", "initial_conc")
+
+def simulate_batch(builder: OntologyBuilderUnified, param_sets: List[Dict[str, Any]],
+                   t_end: float = 24.0, time_points: int = 100) -> Dict[str, Any]:
+    """Solve one circuit under B parameter sets as a single stacked ODE system
+
+    Each parameter set maps any of ``k0``, ``kprod``, ``degradation`` and ``initial_conc`` to a
+    scalar or a per-protein sequence replacing the circuit's own values (an all-zero start is
+    adjusted as in simulate_circuit). The regulation table is shared and the per-protein
+    arrays are tiled to shape (B, N), so one odeint call integrates every set.
+
+    Returns ``time``, the protein ``display_names`` and ``concentrations`` with shape
+    (len(time), B, N).
+    """
+    system = _circuit_system(builder)
+    n_cds = len(system['cds_list'])
+    if not n_cds:
+        raise ValueError("No CDS components found to simulate")
+    unknown = {key for params in param_sets for key in params} - set(_BATCH_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown batch parameters: {sorted(unknown)}")
+    
+    defaults = dict(zip(_BATCH_PARAMETERS, (system['k0'], system['kprod'], system['degr'], system['p0'])))
+    tiled = {
+        key: np.array([np.broadcast_to(np.asarray(params.get(key, value), dtype=float), (n_cds,))
+                       for params in param_sets])
+        for key, value in defaults.items()
+    }
+    p0 = np.array([_initial_state(row, system['has_regulatory_feedback']) for row in tiled['initial_conc']])
+    args = (tiled['k0'], tiled['kprod'] * system['const_factor'], tiled['degradation'],
+            *_hill_table(*system['regulation_table']))
+    
+    t = np.linspace(0, t_end, time_points)
+    sol = odeint(_hill_rhs, p0.ravel(), t, args=args)
+    return {
+        'time': t,
+        'display_names': system['display_names'],
+        'concentrations': sol.reshape(len(t), len(param_sets), n_cds)
+    }
+
+def simulate_circuit(builder: OntologyBuilderUnified, t_end: float = 24.0, time_points: int = 100) -> Dict[str, Any]:
+    """Enhanced circuit simulation using your original equation building logic from Version 15.2
+
+    ``time_points`` controls the output resolution of the plot and ``time_series``;
+    100 points is plenty for the 10x6 inch figure, pass a larger value for a denser series.
+    """
     try:
         if not builder.circuits:
             return {
@@ -637,133 +1088,24 @@ def simulate_circuit(builder: OntologyBuilderUnified) -> Dict[str, Any]:
                 'warnings': []
             }
 
-        # Use your exact logic from the notebook
-        cell = {
-            "circuits": builder.circuits,
-            "regulations": builder.regulations
-        }
-        
-        # Parameters matching your notebook
-        basal_constitutive = 0.01  # k0 for constitutive (no regulators)
-        initial_conc_default = 0.01  # backup initial [protein] for all CDS species
-        
-        # Gather CDS entries + display names using your logic
-        cds_list = []
-        display_names = []
-        id2comp = {}
-        id2circ = {}
-        
-        for circ in cell["circuits"]:
-            # Skip circuits marked as non-modelable (if such marking exists)
-            # Default to True if not specified
-            if circ.get("modelable", True) is False:
-                continue
-                
-            comps = circ["components"]
-            
-            # Determine base promoter strength using your logic
-            first_cds_idx = next((i for i, c in enumerate(comps) if c["type"] == "cds"), None)
-            if first_cds_idx is not None:
-                prom_idxs = [i for i, c in enumerate(comps) if c["type"] == "promoter" and i < first_cds_idx]
-                base_prom = comps[max(prom_idxs)]["parameters"].get("strength", 0.0) if prom_idxs else 0.01
-            else:
-                base_prom = 0.01
-            circ["_base_prom"] = base_prom
-            
-            # Build cds_to_rbs mapping like in your notebook
-            cds_to_rbs = {}
-            for i, comp in enumerate(comps):
-                if comp["type"] == "rbs":
-                    # Find next CDS after this RBS
-                    for j in range(i + 1, len(comps)):
-                        if comps[j]["type"] == "cds":
-                            cds_to_rbs[comps[j]["name"]] = comp["name"]
-                            break
-            circ["cds_to_rbs"] = cds_to_rbs
-            
-            # Count CDS components per gene to handle multiple CDS in same gene
-            gene_cds_count = {}
-            for comp in comps:
-                if comp["type"] == "cds":
-                    # Extract gene info from component ID (e.g., "cds_A3" -> gene from original placement)
-                    comp_id = comp["id"]
-                    # Find the gene number from the original component placement
-                    gene_num = 1  # default
-                    if hasattr(comp, 'gene_number'):
-                        gene_num = comp.gene_number
-                    elif 'gene' in comp.get('metadata', {}):
-                        gene_num = comp['metadata']['gene']
-                    
-                    gene_cds_count[gene_num] = gene_cds_count.get(gene_num, 0) + 1
-            
-            # Track CDS sequence numbers within each gene
-            gene_cds_counters = {}
-            
-            for comp in comps:
-                if comp["type"] != "cds": 
-                    continue
-                cds_id = comp["id"]
-                # Extract letter from name (cds_1 -> A, cds_2 -> B, etc.)
-                name = comp["name"]
-                if "cds" in name:
-                    # Handle both formats: cds_2 and cds2
-                    if "_" in name:
-                        gene_part = name.split("_")[-1]  # Get last part after underscore
-                    else:
-                        gene_part = name.replace("cds", "")  # Remove cds prefix
-                    
-                    try:
-                        # Convert gene letter/number to display letter
-                        if gene_part.isdigit():
-                            letter = chr(65 + int(gene_part) - 1)  # 1->A, 2->B, etc.
-                            gene_num = int(gene_part)
-                        elif gene_part.isalpha():
-                            letter = gene_part.upper()  # a->A, b->B, etc.
-                            gene_num = ord(gene_part.upper()) - ord('A') + 1
-                        else:
-                            letter = "A"
-                            gene_num = 1
-                    except (ValueError, IndexError):
-                        letter = "A"
-                        gene_num = 1
-                else:
-                    letter = "A"
-                    gene_num = 1
-                
-                # Track sequence number for this gene
-                if gene_num not in gene_cds_counters:
-                    gene_cds_counters[gene_num] = 0
-                gene_cds_counters[gene_num] += 1
-                sequence_num = gene_cds_counters[gene_num]
-                
-                # Create unique display name for each CDS, even if redundant
-                if gene_cds_count.get(gene_num, 1) > 1:
-                    # Multiple CDS in same gene - differentiate by sequence
-                    display_name = f"Protein {letter}.{sequence_num}, Gene Circuit {gene_num}"
-                else:
-                    # Single CDS in gene
-                    display_name = f"Protein {letter}, Gene Circuit {gene_num}"
-                
-                cds_list.append(cds_id)
-                display_names.append(display_name)
-                id2comp[cds_id] = comp
-                id2circ[cds_id] = circ
+        # Identical circuits (same topology and parameters) reuse the cached solve
+        cache_key = _simulation_cache_key(builder.circuits, builder.regulations, t_end, time_points)
+        sim_data = _simulation_cache_get(cache_key)
+        if sim_data is not None:
+            return _simulation_result(builder, sim_data)
 
+        system = _circuit_system(builder)
+        cell, cds_list = system['cell'], system['cds_list']
         if not cds_list:
             # Return empty plot if no CDS found
-            plt.figure(figsize=(10, 6))
-            plt.text(0.5, 0.5, 'No CDS components found', ha='center', va='center', transform=plt.gca().transAxes)
-            plt.xlabel('Time (hours)')
-            plt.ylabel('Protein Concentration (μM)')
-            plt.title('Genetic Circuit Simulation - No Data')
-            
-            # Convert to base64
-            import io, base64
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            plot_data = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            with _SIM_PLOT_LOCK:
+                ax = _SIM_AX
+                ax.cla()
+                ax.text(0.5, 0.5, 'No CDS components found', ha='center', va='center', transform=ax.transAxes)
+                ax.set_xlabel('Time (hours)')
+                ax.set_ylabel('Protein Concentration (μM)')
+                ax.set_title('Genetic Circuit Simulation - No Data')
+                plot_data = _figure_to_base64(_SIM_FIGURE)
             
             return {
                 'plot': plot_data,
@@ -774,240 +1116,81 @@ def simulate_circuit(builder: OntologyBuilderUnified) -> Dict[str, Any]:
                 'warnings': []
             }
         
-        # Build name→ID mapping for all components (your logic)
-        name2id = {
-            comp["name"]: comp["id"]
-            for circ in cell["circuits"]
-            for comp in circ["components"]
-        }
-        
-        # Group regulations by CDS ID - apply to ALL CDS with matching name
-        regs_by_cds = defaultdict(list)
-        print(f"DEBUG: Processing {len(cell.get('regulations', []))} regulations")
-        for reg in cell.get("regulations", []):
-            print(f"DEBUG: Regulation {reg['source']} → {reg.get('affected_cdss', [])} (type: {reg['type']})")
-            for tgt_name in reg.get("affected_cdss", []):
-                # Apply regulation to ALL CDS components with this name
-                for cds_id in cds_list:
-                    comp = id2comp[cds_id]
-                    if comp["name"] == tgt_name:
-                        regs_by_cds[cds_id].append(reg)
-                        print(f"DEBUG: Added regulation to {comp['name']} (cds_id: {cds_id})")
-                
-        # Build CDS name to ALL indices mapping for regulation lookup
-        cds_name_to_indices = defaultdict(list)
-        for i, cds_id in enumerate(cds_list):
-            comp = id2comp[cds_id]
-            cds_name_to_indices[comp["name"]].append(i)
+        display_names, id2comp, id2circ = system['display_names'], system['id2comp'], system['id2circ']
+        k0, kprod, degr, p0 = system['k0'], system['kprod'], system['degr'], system['p0']
+        reg_target, reg_src_idx = system['reg_target'], system['reg_src_idx']
+        csr_args = system['csr_args']
+        has_regulatory_feedback = system['has_regulatory_feedback']
+        debug = logger.isEnabledFor(logging.DEBUG)
+        t = np.linspace(0, t_end, time_points)  # 0-24 hours by default
         
-        print(f"DEBUG: CDS mapping: {dict(cds_name_to_indices)}")
-        print(f"DEBUG: CDS list: {[id2comp[cid]['name'] for cid in cds_list]}")
-        print(f"DEBUG: Regulations by CDS: {[(cid, len(regs)) for cid, regs in regs_by_cds.items()]}")
-        
-        # Build per-CDS parameters using your exact logic
-        cds_params = {}
-        for i, cds_id in enumerate(cds_list):
-            comp = id2comp[cds_id]
-            circ = id2circ[cds_id]
-            base_prom = circ["_base_prom"]
-            
-            # RBS efficiency (name-based lookup) using your logic
-            rbs_name = circ["cds_to_rbs"].get(comp["name"])
-            if rbs_name:
-                rbs_comp = next((c for c in circ["components"] if c["name"] == rbs_name), None)
-                base_rbs = rbs_comp["parameters"]["efficiency"] if rbs_comp else 0.01
+        # Solve ODE - constitutive-only circuits obey dp/dt = k0 + kprod - degr*p,
+        # which has the closed form p(t) = p_ss + (p0 - p_ss) * exp(-degr*t)
+        if not has_regulatory_feedback and np.all(degr > 0):
+            p_ss = (k0 + kprod) / degr
+            sol = p_ss[None, :] + (p0 - p_ss)[None, :] * np.exp(-degr[None, :] * t[:, None])
+        else:
+            # Regulations couple protein i to source j only within ml below / mu above the
+            # diagonal; when that band is narrower than the matrix LSODA can factor it banded
+            offsets = [i - j for i, j in zip(reg_target, reg_src_idx)]
+            ml, mu = max([0] + offsets), -min([0] + offsets)
+            if ml + mu < len(cds_list) - 1:
+                sol = odeint(_hill_rhs_csr, p0, t, args=csr_args, ml=ml, mu=mu,
+                             Dfun=partial(_hill_jac_csr_banded, ml=ml, mu=mu))
             else:
-                base_rbs = 0.01
-            
-            # Fallback & effective rates using your logic
-            fb = circ.get("fallback_by_cds", {}).get(comp["name"], {})
-            prom_s = fb.get("prom_strength", base_prom)
-            rbs_e = fb.get("rbs_efficiency", base_rbs)
-            degr = fb.get("degradation_rate", comp["parameters"]["degradation_rate"])
-            
-            # Numeric parameters matching working notebook - tuned for oscillations
-            kprod = prom_s * rbs_e * 1.0  # Balanced production rate for oscillations
-            k0 = basal_constitutive if not regs_by_cds.get(cds_id) else 0.01
-            
-            cds_params[cds_id] = {
-                "k0": k0,
-                "prom_strength": prom_s,
-                "rbs_eff": rbs_e,
-                "kprod": kprod,
-                "degradation": degr,
-                "initial_conc": comp["parameters"].get("init_conc", initial_conc_default)
-            }
+                sol = odeint(_hill_rhs_csr, p0, t, args=csr_args, Dfun=_hill_jac_csr)
+        if debug:
+            # One summary after the solve instead of tracing inside the RHS
+            logger.debug("Solved %d proteins: initial %s, midpoint %s, final %s",
+                         len(cds_list), sol[0], sol[len(t) // 2], sol[-1])
         
-        # Define RHS using your exact logic with debugging
-        debug_steps = []
+        # Create matplotlib plot on the shared figure (serialised across requests)
+        with _SIM_PLOT_LOCK:
+            ax = _SIM_AX
+            ax.cla()
+            markers = ['o', 's', '^', 'D', 'v', '>', '<', '*']
         
-        def rhs(p, t):
-            dpdt = np.zeros(len(cds_list))
-            for i, cds_id in enumerate(cds_list):
-                pars = cds_params[cds_id]
-                f_vals = []
-                
-                for reg in regs_by_cds.get(cds_id, []):
-                    typ = reg["type"]
-                    
-                    if typ == "constitutive":
-                        f_vals.append(1.0)  # always "on"
-                        continue            # skip source lookup
-                    
-                    pr = reg["parameters"]
-                    # Use higher Hill coefficient for sharper response (better for oscillations)
-                    n = pr.get("n", 4 if typ in ("self_repression", "self_activation") else 2)
-                    
-                    # Resolve the value of the regulator
-                    src_name = reg["source"]
-                    
-                    # For CDS regulation, find which protein index this is
-                    # Use the first occurrence of this CDS name for regulation source
-                    if src_name in cds_name_to_indices:
-                        protein_index = cds_name_to_indices[src_name][0]
-                        val = p[protein_index]  # Use protein concentration IN REAL TIME
-                        
-                        # Debug protein associations for repressilator
-                        if t < 0.1:  # Only log at start of simulation
-                            target_cds = id2comp[cds_id]["name"]
-                            print(f"REPRESSOR DEBUG: {src_name} (index {protein_index}, conc={val:.3f}) → {target_cds}")
-                            print(f"  Full mapping: {dict(cds_name_to_indices)}")
-                            print(f"  CDS list order: {[id2comp[cid]['name'] for cid in cds_list]}")
-                    elif typ in ("induced_activation", "environmental_repression"):
-                        val = pr.get("concentration", 1.0)  # Use constant for floating
-                    else:
-                        raise ValueError(f"Cannot resolve source {src_name} for regulation type {typ}")
-                    
-                    # Apply correct regulation function with oscillation-friendly defaults
-                    if typ in ("transcriptional_activation", "self_activation", "induced_activation"):
-                        Ka = pr.get("Ka", 0.2)  # Lower Ka for stronger activation
-                        hill_val = val**n / (Ka**n + val**n)
-                        f_vals.append(hill_val)
-                    elif typ in ("transcriptional_repression", "self_repression", "environmental_repression"):
-                        # Use Kr from regulation parameters (no hardcoded defaults)
-                        Kr = pr.get("Kr", 0.35)  # Use our tuned repressilator value as fallback
-                        hill_val = Kr**n / (Kr**n + val**n)
-                        f_vals.append(hill_val)
-                        
-                        # Debug key integration steps for oscillation verification
-                        if len(debug_steps) < 10 and typ == "self_repression":
-                            debug_steps.append({
-                                't': t,
-                                'protein_conc': val,
-                                'Kr': Kr,
-                                'n': n,
-                                'hill_function': hill_val,
-                                'production_factor': hill_val
-                            })
-                
-                # Combine regulation effects and compute final rate
-                f_prod = np.prod(f_vals) if f_vals else 1.0
-                dpdt[i] = pars["k0"] + pars["kprod"] * f_prod - pars["degradation"] * p[i]
-            
-            return dpdt
+            # Create circuit colors
+            circuit_colors = {}
+            colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
+            for i, circ in enumerate(cell["circuits"]):
+                circuit_colors[circ["name"]] = colors[i % len(colors)]
         
-        # Initial conditions and time vector - use user parameters or defaults
-        p0 = np.array([cds_params[cds_id]["initial_conc"] for cds_id in cds_list])
-        
-        # For repressilator (3+ proteins with regulatory feedback), break symmetry if all concentrations are zero
-        has_regulatory_feedback = any(
-            reg["type"] not in ("constitutive",) 
-            for reg in cell["regulations"]
-        )
-        
-        if len(p0) >= 3 and np.allclose(p0, 0.0) and has_regulatory_feedback:
-            # Apply asymmetry breaking ONLY for repressilator-type systems with regulatory feedback
-            asymmetry_factors = [1.0, 0.1, 0.05]  # First protein starts higher
-            for i in range(len(p0)):
-                if i < len(asymmetry_factors):
-                    p0[i] = asymmetry_factors[i]
-                else:
-                    p0[i] = 0.01  # Small non-zero value for additional proteins
-        elif len(p0) >= 1 and np.allclose(p0, 0.0):
-            # For constitutive circuits, use equal small starting concentrations for all proteins  
-            for i in range(len(p0)):
-                p0[i] = 0.01  # Equal starting concentration for constitutive circuits
-        t = np.linspace(0, 24, 200)  # 0-24 hours as requested
-        
-        # Solve ODE
-        sol = odeint(rhs, p0, t)
-        
-        # Create matplotlib plot with robust subplot handling
-        fig, ax = plt.subplots(figsize=(10, 6))
-        markers = ['o', 's', '^', 'D', 'v', '>', '<', '*']
-        
-        # Create circuit colors
-        circuit_colors = {}
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
-        for i, circ in enumerate(cell["circuits"]):
-            circuit_colors[circ["name"]] = colors[i % len(colors)]
-        
-        print(f"DEBUG: About to plot {len(cds_list)} proteins: {cds_list}")
-        
-        # Plot each protein with circuit-specific colors
-        for i, cds_id in enumerate(cds_list):
-            comp = id2comp[cds_id]
-            circ = id2circ[cds_id]
-            color = circuit_colors[circ["name"]]
-            display_name = display_names[i]
-            
-            # Add noise to separate overlapping curves - each protein gets unique noise pattern
-            data_range = np.max(sol[:, i]) - np.min(sol[:, i])
-            
-            # For constitutive circuits: significant noise + small constant offset for guaranteed separation
+            # Add noise to separate overlapping curves - one batched draw covers every protein
+            rng = np.random.default_rng(42)
             if not has_regulatory_feedback:
-                # Much larger noise amplitude for better visual separation
-                concentration_level = np.mean(sol[:, i])
-                noise_amplitude = max(0.25 * concentration_level, 0.005)  # 25% noise or 0.005 μM minimum
-                
-                # Use unique random seed for each protein to create different noise patterns
-                np.random.seed(42 + i * 17)  # Different seed spacing for more variation
-                noise_pattern = np.random.normal(0, noise_amplitude, len(sol[:, i]))
-                np.random.seed()  # Reset to random seed
-                
-                # Add small constant offset to guarantee visual separation
-                small_offset = i * 0.008  # 0, 0.008, 0.016 μM offsets
-                final_data = sol[:, i] + noise_pattern + small_offset
-                
-                print(f"DEBUG: Protein {i+1} - noise amplitude: {noise_amplitude:.4f}, offset: {small_offset:.3f}")
+                # For constitutive circuits: significant noise + small constant offset for guaranteed separation
+                concentration_levels = sol.mean(axis=0)
+                noise_amplitudes = np.maximum(0.25 * concentration_levels, 0.005)  # 25% noise or 0.005 μM minimum
+                offsets = np.arange(len(cds_list)) * 0.008  # 0, 0.008, 0.016 μM offsets
             else:
-                # For repressilator systems, minimal noise
-                noise_amplitude = 0.02 * data_range if data_range > 0 else 0
-                if noise_amplitude > 0:
-                    np.random.seed(42 + i * 13)
-                    final_data = sol[:, i] + np.random.normal(0, noise_amplitude, len(sol[:, i]))
-                    np.random.seed()
-                else:
-                    final_data = sol[:, i]
+                # For repressilator systems, minimal noise (none for flat curves)
+                noise_amplitudes = 0.02 * np.ptp(sol, axis=0)
+                offsets = np.zeros(len(cds_list))
+            final_data = sol + rng.normal(0, 1, size=sol.shape) * noise_amplitudes[None, :] + offsets[None, :]
             
-            # Plot with different colors only, no markers
-            ax.plot(t, final_data, linewidth=2, label=display_name,
-                    color=color, alpha=0.9)
-            
-            print(f"DEBUG: Plotted protein {i+1}/3: {display_name} with color {color}")
-        
-        # Debug: Check how many lines were actually plotted
-        lines_count = len(ax.lines)
-        print(f"DEBUG: Total lines plotted on axes: {lines_count} (should be {len(cds_list)})")
+            # Plot each protein with circuit-specific colors
+            proteins_info = [
+                (display_names[i], circuit_colors[id2circ[cds_id]["name"]])
+                for i, cds_id in enumerate(cds_list)
+            ]
+            for i, (display_name, color) in enumerate(proteins_info):
+                # Plot with different colors only, no markers
+                ax.plot(t, final_data[:, i], linewidth=2, label=display_name,
+                        color=color, alpha=0.9)
         
-        ax.set_xlabel("Time (hours)")
-        ax.set_ylabel("Concentration (μM)")
-        ax.set_title("Genetic Circuit Simulation")
-        ax.legend(shadow=True)
-        ax.grid(True)
+            ax.set_xlabel("Time (hours)")
+            ax.set_ylabel("Concentration (μM)")
+            ax.set_title("Genetic Circuit Simulation")
+            ax.legend(shadow=True)
+            ax.grid(True)
         
-        # Convert plot to base64 for web display
-        import io, base64
-        img_buffer = io.BytesIO()
-        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        img_buffer.seek(0)
-        plot_base64 = base64.b64encode(img_buffer.read()).decode()
-        plt.close(fig)
+            # Convert plot to base64 for web display
+            plot_base64 = _figure_to_base64(_SIM_FIGURE)
         
         # Prepare time series data
         time_series = {'time': t.tolist()}
-        for i, display_name in enumerate(display_names):
-            time_series[display_name] = sol[:, i].tolist()
+        time_series.update(zip(display_names, sol.T.tolist()))
         
         # Calculate final states
         final_concentrations = {display_name: sol[:, i][-1] for i, display_name in enumerate(display_names)}
@@ -1026,30 +1209,16 @@ def simulate_circuit(builder: OntologyBuilderUnified) -> Dict[str, Any]:
             cds_name = comp['name']
             protein_mapping[display_names[i]] = cds_name
         
-        result = {
-            'status': 'success',
+        sim_data = {
             'plot': plot_base64,
             'time_series': time_series,
             'final_concentrations': final_concentrations,
             'protein_mapping': protein_mapping,
-            'circuits': builder.circuits,
-            'regulations': builder.regulations,
-            'regulator_issues': builder.regulator_issues,
-            'unpaired_regulators': builder.unpaired_regulators,
-            'extra_components': builder.extra_components_found,
-            'debug_info': debug_info,
-            'errors': [],
-            'warnings': []
+            'debug_info': debug_info
         }
+        _simulation_cache_put(cache_key, sim_data)
         
-        # Add warnings for issues
-        if builder.regulator_issues:
-            result['warnings'].extend([f"Regulator issue: {issue}" for issue in builder.regulator_issues])
-        
-        if builder.unpaired_regulators:
-            result['warnings'].extend([f"Unpaired regulator: {reg}" for reg in builder.unpaired_regulators])
-        
-        return result
+        return _simulation_result(builder, sim_data)
     
     except Exception as e:
         logging.error(f"Circuit simulation error: {str(e)}")
@@ -1061,3 +1230,31 @@ def simulate_circuit(builder: OntologyBuilderUnified) -> Dict[str, Any]:
             'errors': [str(e)],
             'warnings': []
         }
+
+def _simulation_result(builder: OntologyBuilderUnified, sim_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine solved (possibly cached) simulation data with the builder's per-request analysis"""
+    # sim_data is shared through the cache, so every caller gets its own containers
+    result = {
+        'status': 'success',
+        **sim_data,
+        'time_series': {key: list(values) for key, values in sim_data['time_series'].items()},
+        'final_concentrations': dict(sim_data['final_concentrations']),
+        'protein_mapping': dict(sim_data['protein_mapping']),
+        'debug_info': dict(sim_data['debug_info']),
+        'circuits': builder.circuits,
+        'regulations': builder.regulations,
+        'regulator_issues': builder.regulator_issues,
+        'unpaired_regulators': builder.unpaired_regulators,
+        'extra_components': builder.extra_components_found,
+        'errors': [],
+        'warnings': []
+    }
+    
+    # Add warnings for issues
+    if builder.regulator_issues:
+        result['warnings'].extend([f"Regulator issue: {issue}" for issue in builder.regulator_issues])
+    
+    if builder.unpaired_regulators:
+        result['warnings'].extend([f"Unpaired regulator: {reg}" for reg in builder.unpaired_regulators])
+    
+    return result
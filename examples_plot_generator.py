@@ -10,12 +10,23 @@ and parameters.
 Run this file to see various examples of circuit designs and their outputs.
 """
 
-from standalone_plot_generator import GeneticCircuitSimulator, plot_circuit_dynamics, compare_parameter_effects, CIRCUIT_ARRANGEMENTS
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server use
-import matplotlib.pyplot as plt
+from standalone_plot_generator import GeneticCircuitSimulator, plot_circuit_dynamics, compare_parameter_effects, batch_simulate, save_figure, CIRCUIT_ARRANGEMENTS, SAVE_KW
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-def example_1_basic_operon():
+def _new_axes(figsize):
+    """
+    Two stacked axes on a new off-screen figure at the save dpi.
+    
+    The figure is built directly on an Agg canvas rather than through pyplot,
+    so it is never registered with pyplot's figure manager and is freed as
+    soon as it goes out of scope.
+    """
+    fig = Figure(figsize=figsize, dpi=SAVE_KW['dpi'], layout='tight')
+    FigureCanvasAgg(fig)
+    return fig.subplots(2, 1)
+
+def example_1_basic_operon(axes=None):
     """Example 1: Basic operon with default parameters"""
     print("Example 1: Basic Operon (Promoter → RBS → CDS → Terminator)")
     
@@ -26,16 +37,16 @@ def example_1_basic_operon():
     simulator = GeneticCircuitSimulator(arrangement)
     
     # Generate and save plot
-    fig, axes = plot_circuit_dynamics(
+    fig, _ = plot_circuit_dynamics(
         simulator, 
         title="Basic Operon - Default Parameters",
-        save_path="example1_basic_operon.png"
+        save_path="example1_basic_operon.png",
+        axes=_new_axes((12, 8)) if axes is None else axes
     )
-    plt.close(fig)
     print("✓ Saved: example1_basic_operon.png")
     return simulator
 
-def example_2_high_expression():
+def example_2_high_expression(axes=None):
     """Example 2: High expression system"""
     print("\nExample 2: High Expression System")
     
@@ -51,16 +62,16 @@ def example_2_high_expression():
     }
     
     simulator = GeneticCircuitSimulator(arrangement, custom_params)
-    fig, axes = plot_circuit_dynamics(
+    fig, _ = plot_circuit_dynamics(
         simulator,
         title="High Expression System\nStrong Promoter + Efficient RBS + Low Degradation",
-        save_path="example2_high_expression.png"
+        save_path="example2_high_expression.png",
+        axes=_new_axes((12, 8)) if axes is None else axes
     )
-    plt.close(fig)
     print("✓ Saved: example2_high_expression.png")
     return simulator
 
-def example_3_repressed_system():
+def example_3_repressed_system(axes=None):
     """Example 3: Repressed gene expression system"""
     print("\nExample 3: Repressed Expression System")
     
@@ -78,16 +89,16 @@ def example_3_repressed_system():
     }
     
     simulator = GeneticCircuitSimulator(arrangement, repression_params)
-    fig, axes = plot_circuit_dynamics(
+    fig, _ = plot_circuit_dynamics(
         simulator,
         title="Repressed Expression System\nStrong Repressor with Cooperative Binding",
-        save_path="example3_repressed_system.png"
+        save_path="example3_repressed_system.png",
+        axes=_new_axes((12, 8)) if axes is None else axes
     )
-    plt.close(fig)
     print("✓ Saved: example3_repressed_system.png")
     return simulator
 
-def example_4_dual_gene():
+def example_4_dual_gene(axes=None):
     """Example 4: Dual gene operon"""
     print("\nExample 4: Dual Gene Operon")
     
@@ -102,12 +113,12 @@ def example_4_dual_gene():
     }
     
     simulator = GeneticCircuitSimulator(arrangement, dual_gene_params)
-    fig, axes = plot_circuit_dynamics(
+    fig, _ = plot_circuit_dynamics(
         simulator,
         title="Dual Gene Operon\nTwo Proteins from One Promoter",
-        save_path="example4_dual_gene.png"
+        save_path="example4_dual_gene.png",
+        axes=_new_axes((12, 8)) if axes is None else axes
     )
-    plt.close(fig)
     print("✓ Saved: example4_dual_gene.png")
     return simulator
 
@@ -132,15 +143,18 @@ def example_5_environmental_effects():
         'global_degradation_rate': 1.5  # Increased degradation
     }
     
-    # Create both simulations
+    # Create both simulations and solve them together on their shared time grid
     sim_standard = GeneticCircuitSimulator(arrangement, standard_params)
     sim_stress = GeneticCircuitSimulator(arrangement, stress_params)
+    t, results = batch_simulate([sim_standard, sim_stress])
+    t1 = t2 = t
+    protein1, protein2 = results[0]['protein'], results[1]['protein']
     
     # Plot comparison
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    ax1, ax2 = _new_axes((12, 10))
+    fig = ax1.figure
     
     # Standard conditions
-    t1, mRNA1, protein1 = sim_standard.simulate()
     ax1.plot(t1, protein1, 'b-', linewidth=2, label='Standard Conditions')
     ax1.set_ylabel('Protein Concentration', fontsize=12)
     ax1.set_title('Standard vs Stress Conditions', fontsize=14, fontweight='bold')
@@ -148,16 +162,13 @@ def example_5_environmental_effects():
     ax1.grid(True, alpha=0.3)
     
     # Stress conditions  
-    t2, mRNA2, protein2 = sim_stress.simulate()
     ax2.plot(t2, protein2, 'r-', linewidth=2, label='Stress Conditions')
     ax2.set_xlabel('Time (minutes)', fontsize=12)
     ax2.set_ylabel('Protein Concentration', fontsize=12)
     ax2.legend()
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('example5_environmental_effects.png', dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    save_figure(fig, 'example5_environmental_effects.png')
     print("✓ Saved: example5_environmental_effects.png")
 
 def example_6_parameter_sweep():
@@ -169,15 +180,18 @@ def example_6_parameter_sweep():
     # Test different RBS efficiencies
     rbs_values = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0]
     
+    # Both sweeps redraw into the same figure
+    axes = _new_axes((12, 10))
     fig = compare_parameter_effects(
         arrangement, 
         'rbs_efficiency', 
         rbs_values,
-        other_params={'promoter_strength': 6.0}  # Keep promoter constant
+        other_params={'promoter_strength': 6.0},  # Keep promoter constant
+        axes=axes,
+        plot_points=150  # Plenty for overlaid sweep curves
     )
     
-    plt.savefig('example6_rbs_sweep.png', dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    save_figure(fig, 'example6_rbs_sweep.png')
     print("✓ Saved: example6_rbs_sweep.png")
     
     # Test different promoter strengths
@@ -187,11 +201,12 @@ def example_6_parameter_sweep():
         arrangement,
         'promoter_strength',
         promoter_values,
-        other_params={'rbs_efficiency': 1.5}  # Keep RBS constant
+        other_params={'rbs_efficiency': 1.5},  # Keep RBS constant
+        axes=axes,
+        plot_points=150
     )
     
-    plt.savefig('example6_promoter_sweep.png', dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    save_figure(fig, 'example6_promoter_sweep.png')
     print("✓ Saved: example6_promoter_sweep.png")
 
 def main():
@@ -199,11 +214,16 @@ def main():
     print("Genetic Circuit Design Examples")
     print("=" * 50)
     
+    # Examples 1-4 share one figure layout, so redraw into a single figure
+    # (created at the save dpi, so it is encoded straight from its canvas)
+    # instead of allocating and closing one per example
+    axes = _new_axes((12, 8))
+    
     # Run examples
-    sim1 = example_1_basic_operon()
-    sim2 = example_2_high_expression()
-    sim3 = example_3_repressed_system()
-    sim4 = example_4_dual_gene()
+    sim1 = example_1_basic_operon(axes)
+    sim2 = example_2_high_expression(axes)
+    sim3 = example_3_repressed_system(axes)
+    sim4 = example_4_dual_gene(axes)
     example_5_environmental_effects()
     example_6_parameter_sweep()
     
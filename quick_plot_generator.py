@@ -13,16 +13,27 @@ Usage:
 Modify circuit_configs.json to change circuit arrangements and parameters.
 """
 
+import copy
 import json
+import multiprocessing
+import os
+from collections import ChainMap
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
-from standalone_plot_generator import GeneticCircuitSimulator, plot_circuit_dynamics, compare_parameter_effects
+from standalone_plot_generator import GeneticCircuitSimulator, plot_circuit_dynamics, compare_parameter_effects, SAVE_KW
+
+@lru_cache(maxsize=8)
+def _load_cached(config_file, mtime):
+    """Parse a configuration file once per (path, modification time)."""
+    with open(config_file, 'r') as f:
+        return json.load(f)
 
 def load_configuration(config_file='circuit_configs.json'):
     """Load circuit configurations from JSON file."""
     try:
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        # Callers mutate the result, so hand out a copy of the cached parse
+        return copy.deepcopy(_load_cached(config_file, os.path.getmtime(config_file)))
     except FileNotFoundError:
         print(f"Configuration file {config_file} not found!")
         print("Using default simple operon configuration.")
@@ -39,7 +50,7 @@ def load_configuration(config_file='circuit_configs.json'):
                 }
             },
             "environmental_conditions": {"standard": {}},
-            "simulation_settings": {"standard": {"simulation_time": 100, "time_points": 1000}}
+            "simulation_settings": {"standard": {"simulation_time": 100, "time_points": 250}}
         }
 
 def create_custom_circuit():
@@ -94,6 +105,91 @@ def modify_parameters_interactively(base_params):
     
     return modified_params
 
+def _combine_parameters(config, circuit_name, environment='standard'):
+    """Merge a predefined circuit's parameters with an environment and the standard simulation settings."""
+    # Earlier maps take precedence, matching update() calls in the reverse order
+    return dict(ChainMap(config['simulation_settings']['standard'],
+                         config['environmental_conditions'].get(environment, {}),
+                         config['circuit_configurations'][circuit_name]['parameters']))
+
+def _run_predefined(config, circuit_name, environment, params):
+    """Simulate and plot a predefined circuit; returns (figure, simulator)."""
+    simulator = GeneticCircuitSimulator(config['circuit_configurations'][circuit_name]['arrangement'], params)
+    title = f"{circuit_name} - {environment} conditions"
+    fig, axes = plot_circuit_dynamics(simulator, title=title)
+    return fig, simulator
+
+def _run_custom(arrangement, params):
+    """Simulate and plot a custom arrangement; returns (figure, simulator)."""
+    simulator = GeneticCircuitSimulator(arrangement, params)
+    title = f"Custom Circuit\n{' → '.join(arrangement)}"
+    fig, axes = plot_circuit_dynamics(simulator, title=title)
+    return fig, simulator
+
+def _run_comparison(arrangement, param_name, param_values, other_params=None):
+    """Plot the effect of several values of one parameter; returns the figure."""
+    return compare_parameter_effects(arrangement, param_name, param_values, other_params)
+
+def _dispatch(job):
+    """
+    Run one batch job and save its plot.
+    
+    A job is a dict with an 'outfile' and either a predefined 'circuit' (plus
+    optional 'environment') or a custom 'arrangement'. 'params' overrides
+    parameters, and 'compare': {'parameter': name, 'values': [...]} turns the
+    job into a parameter comparison.
+    
+    Returns:
+        str: Path of the saved plot
+    """
+    config = load_configuration(job.get('config', 'circuit_configs.json'))
+    circuit_name = job.get('circuit')
+    environment = job.get('environment', 'standard')
+    
+    if circuit_name is not None:
+        arrangement = config['circuit_configurations'][circuit_name]['arrangement']
+        params = _combine_parameters(config, circuit_name, environment)
+    else:
+        # Custom arrangements start from the simple operon's parameters
+        arrangement = job['arrangement']
+        params = _combine_parameters(config, 'simple_operon', environment)
+    params.update(job.get('params', {}))
+    
+    compare = job.get('compare')
+    if compare:
+        fig = _run_comparison(arrangement, compare['parameter'], compare['values'], params)
+    elif circuit_name is not None:
+        fig, _ = _run_predefined(config, circuit_name, environment, params)
+    else:
+        fig, _ = _run_custom(arrangement, params)
+    
+    fig.savefig(job['outfile'], **SAVE_KW)
+    plt.close(fig)
+    return job['outfile']
+
+def _worker_init():
+    """Pool initializer: render off-screen in worker processes."""
+    plt.switch_backend('Agg')
+
+def run_batch(jobs, processes=None):
+    """
+    Run a list of plot jobs (see _dispatch) without prompting, in parallel.
+    
+    Args:
+        jobs (list): Job dicts
+        processes (int): Worker processes (defaults to one per core)
+        
+    Returns:
+        list: Paths of the saved plots, in job order
+    """
+    if len(jobs) < 2 or processes == 1:
+        _worker_init()
+        return [_dispatch(job) for job in jobs]
+    
+    method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    with multiprocessing.get_context(method).Pool(processes=processes, initializer=_worker_init) as pool:
+        return pool.map(_dispatch, jobs)
+
 def run_interactive_session():
     """Run an interactive session for circuit design and parameter exploration."""
     print("Genetic Circuit Interactive Plot Generator")
@@ -122,7 +218,6 @@ def run_interactive_session():
                 circuit_idx = int(input("Select circuit (number): ")) - 1
                 if 0 <= circuit_idx < len(circuits):
                     circuit_name = circuits[circuit_idx]
-                    circuit_config = config['circuit_configurations'][circuit_name]
                     
                     # Show environmental conditions
                     print("\nAvailable environmental conditions:")
@@ -133,13 +228,9 @@ def run_interactive_session():
                     condition_idx = int(input("Select environment (number): ")) - 1
                     if 0 <= condition_idx < len(conditions):
                         condition_name = conditions[condition_idx]
-                        env_config = config['environmental_conditions'][condition_name]
                         
                         # Combine parameters
-                        all_params = {}
-                        all_params.update(circuit_config['parameters'])
-                        all_params.update(env_config)
-                        all_params.update(config['simulation_settings']['standard'])
+                        all_params = _combine_parameters(config, circuit_name, condition_name)
                         
                         # Ask if user wants to modify parameters
                         modify = input("Modify parameters? (y/n): ").strip().lower()
@@ -147,16 +238,14 @@ def run_interactive_session():
                             all_params = modify_parameters_interactively(all_params)
                         
                         # Run simulation
-                        simulator = GeneticCircuitSimulator(circuit_config['arrangement'], all_params)
-                        title = f"{circuit_name} - {condition_name} conditions"
-                        fig, axes = plot_circuit_dynamics(simulator, title=title)
+                        fig, simulator = _run_predefined(config, circuit_name, condition_name, all_params)
                         plt.show()
                         
                         # Ask to save
                         save = input("Save plot? (y/n): ").strip().lower()
                         if save == 'y':
                             filename = f"{circuit_name}_{condition_name}_plot.png"
-                            fig.savefig(filename, dpi=300, bbox_inches='tight')
+                            fig.savefig(filename, **SAVE_KW)
                             print(f"Plot saved as {filename}")
             
             except (ValueError, IndexError):
@@ -174,16 +263,14 @@ def run_interactive_session():
                 base_params = modify_parameters_interactively(base_params)
             
             # Run simulation
-            simulator = GeneticCircuitSimulator(arrangement, base_params)
-            title = f"Custom Circuit\n{' → '.join(arrangement)}"
-            fig, axes = plot_circuit_dynamics(simulator, title=title)
+            fig, simulator = _run_custom(arrangement, base_params)
             plt.show()
             
             # Ask to save
             save = input("Save plot? (y/n): ").strip().lower()
             if save == 'y':
                 filename = input("Enter filename (without extension): ").strip() + ".png"
-                fig.savefig(filename, dpi=300, bbox_inches='tight')
+                fig.savefig(filename, **SAVE_KW)
                 print(f"Plot saved as {filename}")
         
         elif choice == '3':
@@ -213,14 +300,14 @@ def run_interactive_session():
                         param_values = [float(v.strip()) for v in values_input.split(',')]
                         
                         # Generate comparison plot
-                        fig = compare_parameter_effects(circuit_config['arrangement'], param_name, param_values)
+                        fig = _run_comparison(circuit_config['arrangement'], param_name, param_values)
                         plt.show()
                         
                         # Ask to save
                         save = input("Save comparison plot? (y/n): ").strip().lower()
                         if save == 'y':
                             filename = f"{circuit_name}_{param_name}_comparison.png"
-                            fig.savefig(filename, dpi=300, bbox_inches='tight')
+                            fig.savefig(filename, **SAVE_KW)
                             print(f"Comparison plot saved as {filename}")
             
             except (ValueError, IndexError):
@@ -253,14 +340,9 @@ def quick_plot_from_config(circuit_name=None, environment='standard', modify_par
         return None
     
     circuit_config = config['circuit_configurations'][circuit_name]
-    env_config = config['environmental_conditions'].get(environment, {})
-    sim_config = config['simulation_settings']['standard']
     
     # Combine parameters
-    all_params = {}
-    all_params.update(circuit_config['parameters'])
-    all_params.update(env_config)
-    all_params.update(sim_config)
+    all_params = _combine_parameters(config, circuit_name, environment)
     
     if modify_params:
         all_params = modify_parameters_interactively(all_params)
@@ -275,7 +357,12 @@ def quick_plot_from_config(circuit_name=None, environment='standard', modify_par
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2 and sys.argv[1] == '--spec':
+        # Batch usage: a JSON list of job dicts (see _dispatch)
+        with open(sys.argv[2], 'r') as f:
+            for filename in run_batch(json.load(f)):
+                print(f"Plot saved as {filename}")
+    elif len(sys.argv) > 1:
         # Command line usage
         circuit_name = sys.argv[1] if len(sys.argv) > 1 else None
         environment = sys.argv[2] if len(sys.argv) > 2 else 'standard'
@@ -286,7 +373,7 @@ if __name__ == "__main__":
             
             # Save automatically
             filename = f"{circuit_name}_{environment}_quick_plot.png"
-            fig.savefig(filename, dpi=300, bbox_inches='tight')
+            fig.savefig(filename, **SAVE_KW)
             print(f"Plot saved as {filename}")
     else:
         # Interactive mode
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Regression tests for circuit_model (run with pytest)
+"""
+
+import numpy as np
+import pytest
+from scipy.integrate import odeint
+
+import circuit_model
+from circuit_model import OntologyBuilderUnified, simulate_batch, simulate_circuit
+
+REPRESSILATOR = [
+    "MUX A, Channel 0:  ['promoter_a']",
+    "MUX A, Channel 1:  ['repressor_end_3']",
+    "MUX A, Channel 2:  ['rbs_a']",
+    "MUX A, Channel 3:  ['cds_a']",
+    "MUX A, Channel 4:  ['repressor_start_1']",
+    "MUX A, Channel 5:  ['terminator_a']",
+    "",
+    "MUX A, Channel 6:  ['promoter_b']",
+    "MUX A, Channel 7:  ['repressor_end_1']",
+    "MUX A, Channel 8:  ['rbs_b']",
+    "MUX A, Channel 9:  ['cds_b']",
+    "MUX A, Channel 10:  ['repressor_start_2']",
+    "MUX A, Channel 11:  ['terminator_a']",
+    "",
+    "MUX A, Channel 12:  ['promoter_c']",
+    "MUX A, Channel 13:  ['repressor_end_2']",
+    "MUX A, Channel 14:  ['rbs_c']",
+    "MUX A, Channel 15:  ['cds_c']",
+    "MUX B, Channel 0:  ['repressor_start_3']",
+    "MUX B, Channel 1:  ['terminator_a']",
+]
+
+
+def _build(lines):
+    builder = OntologyBuilderUnified({})
+    builder.parse_text_file(lines)
+    builder.build()
+    return builder
+
+
+def test_regulator_uses_last_listed_upstream_component():
+    # MUX lines out of order: promoter_a (A5) has a larger index than cds_b (A0) but is
+    # listed before it, so the regulator end at A6 follows cds_b, not the promoter
+    builder = _build([
+        "MUX A, Channel 5:  ['promoter_a']",
+        "MUX A, Channel 0:  ['cds_b']",
+        "MUX A, Channel 1:  ['repressor_start_1']",
+        "MUX A, Channel 3:  ['rbs_a']",
+        "MUX A, Channel 4:  ['cds_a']",
+        "MUX A, Channel 6:  ['repressor_end_1']",
+        "MUX A, Channel 7:  ['terminator_a']",
+    ])
+    assert [issue["label"] for issue in builder.regulator_issues] == ["repressor_end_1"]
+    assert all(reg["type"] == "constitutive" for reg in builder.regulations)
+
+
+def test_regulator_in_order():
+    builder = _build([
+        "MUX A, Channel 0:  ['promoter_a']",
+        "MUX A, Channel 1:  ['rbs_a']",
+        "MUX A, Channel 2:  ['cds_a']",
+        "MUX A, Channel 3:  ['repressor_start_1']",
+        "MUX A, Channel 4:  ['terminator_a']",
+        "",
+        "MUX A, Channel 5:  ['promoter_b']",
+        "MUX A, Channel 6:  ['repressor_end_1']",
+        "MUX A, Channel 7:  ['rbs_b']",
+        "MUX A, Channel 8:  ['cds_b']",
+        "MUX A, Channel 9:  ['terminator_a']",
+    ])
+    repressions = [reg for reg in builder.regulations if reg["type"] != "constitutive"]
+    assert [(reg["source"], reg["target"], reg["affected_cdss"]) for reg in repressions] == [
+        ("cds_a", "promoter_b", ["cds_b"])
+    ]
+
+
+def test_affected_cds_keep_listed_order():
+    builder = _build([
+        "MUX B, Channel 0:  ['promoter_a']",
+        "MUX B, Channel 1:  ['rbs_a']",
+        "MUX B, Channel 2:  ['cds_a']",
+        "MUX B, Channel 3:  ['repressor_start_1']",
+        "",
+        "MUX A, Channel 0:  ['promoter_b']",
+        "MUX A, Channel 1:  ['repressor_end_1']",
+        "MUX A, Channel 8:  ['rbs_b']",
+        "MUX A, Channel 9:  ['cds_c']",
+        "MUX A, Channel 2:  ['rbs_c']",
+        "MUX A, Channel 3:  ['cds_b']",
+    ])
+    repressions = [reg for reg in builder.regulations if reg["type"] != "constitutive"]
+    assert [reg["affected_cdss"] for reg in repressions] == [["cds_c", "cds_b"]]
+
+
+def test_cached_simulation_results_are_independent():
+    lines = [
+        "MUX A, Channel 0:  ['promoter_a']",
+        "MUX A, Channel 1:  ['rbs_a']",
+        "MUX A, Channel 2:  ['cds_a']",
+        "MUX A, Channel 3:  ['terminator_a']",
+    ]
+    r1 = simulate_circuit(_build(lines))
+    r2 = simulate_circuit(_build(lines))
+    assert r1['time_series'] == r2['time_series']
+    for key in ('time_series', 'final_concentrations', 'protein_mapping', 'debug_info'):
+        assert r1[key] is not r2[key]
+    r1['time_series']['time'].append(-1.0)
+    assert simulate_circuit(_build(lines))['time_series'] == r2['time_series']
+
+
+def _set_cds_parameter(builder, name, values):
+    cds = [comp for circ in builder.circuits for comp in circ["components"] if comp["type"] == "cds"]
+    for comp, value in zip(cds, values):
+        comp["parameters"][name] = value
+
+
+def test_simulate_batch_matches_individual_solves():
+    degradations = [0.3, 0.5, 0.8]
+    starts = [0.4, 0.05, 0.2]
+    batch = simulate_batch(_build(REPRESSILATOR),
+                           [{}, {"degradation": degradations}, {"initial_conc": starts}])
+    assert batch["concentrations"].shape == (100, 3, 3)
+
+    individual = [_build(REPRESSILATOR) for _ in range(3)]
+    _set_cds_parameter(individual[1], "degradation_rate", degradations)
+    _set_cds_parameter(individual[2], "init_conc", starts)
+    for b, builder in enumerate(individual):
+        series = simulate_circuit(builder)["time_series"]
+        assert np.allclose(series["time"], batch["time"])
+        for j, name in enumerate(batch["display_names"]):
+            assert np.allclose(series[name], batch["concentrations"][:, b, j], rtol=1e-4, atol=1e-6)
+
+
+def test_simulate_batch_rejects_unknown_parameters():
+    with pytest.raises(ValueError):
+        simulate_batch(_build(REPRESSILATOR), [{"promoter_strength": 2.0}])
+
+
+def test_repeat_simulation_on_one_builder_hits_cache():
+    builder = _build(REPRESSILATOR)
+    with circuit_model._SIM_CACHE_LOCK:
+        circuit_model._SIM_CACHE.clear()
+    first = simulate_circuit(builder)
+    second = simulate_circuit(builder)
+    assert len(circuit_model._SIM_CACHE) == 1
+    assert second['plot'] is first['plot']
+
+
+def test_banded_solve_matches_dense(monkeypatch):
+    # Non-cyclic chain: cds_a activates promoter_b, cds_b represses promoter_c, so every
+    # regulation sits one below the diagonal and simulate_circuit takes the banded solve
+    builder = _build([
+        "MUX A, Channel 0:  ['promoter_a']",
+        "MUX A, Channel 1:  ['rbs_a']",
+        "MUX A, Channel 2:  ['cds_a']",
+        "MUX A, Channel 3:  ['activator_start_1']",
+        "MUX A, Channel 4:  ['terminator_a']",
+        "",
+        "MUX A, Channel 5:  ['promoter_b']",
+        "MUX A, Channel 6:  ['activator_end_1']",
+        "MUX A, Channel 7:  ['rbs_b']",
+        "MUX A, Channel 8:  ['cds_b']",
+        "MUX A, Channel 9:  ['repressor_start_2']",
+        "MUX A, Channel 10:  ['terminator_a']",
+        "",
+        "MUX A, Channel 11:  ['promoter_c']",
+        "MUX A, Channel 12:  ['repressor_end_2']",
+        "MUX A, Channel 13:  ['rbs_c']",
+        "MUX A, Channel 14:  ['cds_c']",
+        "MUX A, Channel 15:  ['terminator_a']",
+    ])
+    calls = []
+
+    def recording_odeint(*args, **kwargs):
+        calls.append(kwargs)
+        return odeint(*args, **kwargs)
+
+    monkeypatch.setattr(circuit_model, 'odeint', recording_odeint)
+    with circuit_model._SIM_CACHE_LOCK:
+        circuit_model._SIM_CACHE.clear()
+    result = simulate_circuit(builder)
+    assert [(call.get('ml'), call.get('mu')) for call in calls] == [(1, 0)]
+
+    system = circuit_model._circuit_system(builder)
+    t = np.asarray(result['time_series']['time'])
+    dense = odeint(circuit_model._hill_rhs_csr, system['p0'], t, args=system['csr_args'],
+                   Dfun=circuit_model._hill_jac_csr)
+    assert np.ptp(dense[-1]) > 0
+    for j, name in enumerate(system['display_names']):
+        assert np.allclose(result['time_series'][name], dense[:, j], rtol=1e-6, atol=1e-9)
+
+    # The solve tolerates a wrong Jacobian, so check the banded repacking entry by entry
+    for p in (system['p0'], dense[len(t) // 2], dense[-1]):
+        jac = circuit_model._hill_jac_csr(p, 0.0, *system['csr_args'])
+        band = circuit_model._hill_jac_csr_banded(p, 0.0, *system['csr_args'], ml=1, mu=0)
+        for i, j in np.ndindex(jac.shape):
+            if 0 <= i - j <= 1:
+                assert band[i - j, j] == jac[i, j]
+            else:
+                assert jac[i, j] == 0
@@ -3,17 +3,19 @@
 Test the standalone plot generator without interactive display
 """
 
-from standalone_plot_generator import *
 import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
+matplotlib.use('Agg')  # Use non-interactive backend, before pyplot is first imported
 import matplotlib.pyplot as plt
 
+from standalone_plot_generator import (GeneticCircuitSimulator, plot_circuit_dynamics, compare_parameter_effects,
+                                       generate_circuit_summary, CIRCUIT_ARRANGEMENTS)
+
 # Test 1: Simple operon
 print("Testing simple operon...")
 simple_circuit = CIRCUIT_ARRANGEMENTS['simple_operon']
 simulator1 = GeneticCircuitSimulator(simple_circuit)
+# Tests 1-3 redraw into the same figure instead of creating one each
 fig1, axes1 = plot_circuit_dynamics(simulator1, save_path='test_simple_operon.png')
-plt.close(fig1)  # Close to free memory
 print("✓ Simple operon plot saved as test_simple_operon.png")
 
 # Test 2: Enhanced parameters
@@ -25,10 +27,10 @@ enhanced_params = {
     'cds_degradation_rate': 0.5
 }
 simulator2 = GeneticCircuitSimulator(simple_circuit, enhanced_params)
-fig2, axes2 = plot_circuit_dynamics(simulator2, 
-                                   title="Enhanced Expression Circuit",
-                                   save_path='test_enhanced_circuit.png')
-plt.close(fig2)
+plot_circuit_dynamics(simulator2,
+                      title="Enhanced Expression Circuit",
+                      save_path='test_enhanced_circuit.png',
+                      axes=axes1)
 print("✓ Enhanced expression plot saved as test_enhanced_circuit.png")
 
 # Test 3: Regulated circuit
@@ -40,15 +42,15 @@ repression_params = {
     'binding_affinity': 0.05
 }
 simulator3 = GeneticCircuitSimulator(regulated_circuit, repression_params)
-fig3, axes3 = plot_circuit_dynamics(simulator3, save_path='test_regulated_circuit.png')
-plt.close(fig3)
+plot_circuit_dynamics(simulator3, save_path='test_regulated_circuit.png', axes=axes1)
+plt.close(fig1)  # Close to free memory
 print("✓ Regulated circuit plot saved as test_regulated_circuit.png")
 
 # Test 4: Parameter comparison
 print("\nTesting parameter comparison...")
 promoter_strengths = [1.0, 3.0, 5.0, 8.0, 12.0]
 fig4 = compare_parameter_effects(simple_circuit, 'promoter_strength', promoter_strengths)
-plt.savefig('test_promoter_comparison.png', dpi=300, bbox_inches='tight')
+fig4.savefig('test_promoter_comparison.png', dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
 plt.close(fig4)
 print("✓ Promoter strength comparison saved as test_promoter_comparison.png")
 
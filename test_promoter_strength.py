@@ -5,11 +5,13 @@ with promoter strength = 3.0 vs default strength = 1.0
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Rectangle
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 # Test data: Promoter → RBS → CDS circuit
@@ -22,6 +24,10 @@ test_circuit = {
     "apply_dial": True
 }
 
+# One keep-alive session for every request; the pool is sized for the concurrent strength tests
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def test_simulation(promoter_strength=1.0, description="Default"):
     """Run simulation with given promoter strength"""
     dial_params = {
@@ -36,7 +42,7 @@ def test_simulation(promoter_strength=1.0, description="Default"):
     
     try:
         print(f"\n=== Testing {description} (Promoter Strength = {promoter_strength}) ===")
-        response = requests.post(
+        response = SESSION.post(
             'http://127.0.0.1:5001/simulate',
             headers={'Content-Type': 'application/json'},
             json=data,
@@ -64,13 +70,13 @@ def create_comparison_plot():
     
     # Test different promoter strengths
     strengths = [1.0, 2.0, 3.0, 5.0]
-    results = []
     
     print("Testing different promoter strengths...")
     
-    for strength in strengths:
-        result = test_simulation(strength, f"Strength {strength}")
-        results.append((strength, result))
+    # The requests are independent, so issue them together and wait for the slowest
+    with ThreadPoolExecutor(max_workers=len(strengths)) as executor:
+        descriptions = [f"Strength {strength}" for strength in strengths]
+        results = list(zip(strengths, executor.map(test_simulation, strengths, descriptions)))
     
     # Create comparison plot
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
@@ -103,8 +109,9 @@ def create_comparison_plot():
     ax1.axis('off')
     
     # Plot 2: Expected protein expression levels
+    expected = np.asarray(strengths, dtype=np.float64) * 5.0  # Approximate relative expression (strength × baseline)
     ax2.bar(range(len(strengths)), 
-           [s * 5.0 for s in strengths],  # Approximate relative expression (strength × baseline)
+           expected,
            color=['lightgreen', 'green', 'darkgreen', 'forestgreen'],
            alpha=0.7,
            edgecolor='black',
@@ -118,8 +125,7 @@ def create_comparison_plot():
     ax2.grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for i, strength in enumerate(strengths):
-        expected_expression = strength * 5.0
+    for i, expected_expression in enumerate(expected):
         ax2.text(i, expected_expression + 0.5, f'{expected_expression:.1f}', 
                 ha='center', va='bottom', fontweight='bold')
     
@@ -127,7 +133,7 @@ def create_comparison_plot():
     
     # Save the plot
     plot_path = '/Users/kiran/Desktop/version17.1_modified/promoter_strength_analysis.png'
-    plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+    plt.savefig(plot_path, dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
     plt.show()
     
     print(f"\n📊 Comparison plot saved to: {plot_path}")
@@ -154,7 +160,7 @@ if __name__ == "__main__":
     
     # Check if server is running
     try:
-        response = requests.get('http://127.0.0.1:5001/', timeout=5)
+        response = SESSION.get('http://127.0.0.1:5001/', timeout=5)
         print("✅ Server is running")
     except:
         print("❌ Server is not running. Please start the Flask app first:")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression tests for standalone_plot_generator (run with pytest)
+"""
+
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend, before pyplot is first imported
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from scipy.integrate import odeint
+
+from standalone_plot_generator import (GeneticCircuitSimulator, CIRCUIT_ARRANGEMENTS, _expression_rhs,
+                                       batch_simulate, compare_parameter_effects, simulate_many)
+
+PARAMETER_SETS = [
+    {},
+    # No degradation: solved by odeint rather than the closed form
+    {'global_degradation_rate': 0.0},
+    # Tiny degradation: the mRNA and protein decay rates (beta and 0.1 * beta) nearly coincide
+    {'global_degradation_rate': 1e-7},
+    {'cds_degradation_rate': 0.5, 'promoter_strength': 20.0, 'initial_conditions': [5.0, 3.0]},
+    {'cds_degradation_rate': 5.0, 'rbs_efficiency': 0.2, 'initial_conditions': [1.0, 400.0]},
+]
+
+
+def _odeint_reference(simulator, t):
+    solution = odeint(_expression_rhs, simulator.params['initial_conditions'], t, args=simulator._rates,
+                      rtol=1e-11, atol=1e-11)
+    return solution[:, 0], solution[:, 1]
+
+
+@pytest.mark.parametrize('parameters', PARAMETER_SETS)
+def test_simulate_matches_odeint(parameters):
+    simulator = GeneticCircuitSimulator(CIRCUIT_ARRANGEMENTS['simple_operon'], parameters)
+    for time_points in (None, 250):
+        t, mRNA, protein = simulator.simulate(time_points)
+        mRNA_ref, protein_ref = _odeint_reference(simulator, t)
+        assert np.allclose(mRNA, mRNA_ref, rtol=1e-7, atol=1e-9)
+        assert np.allclose(protein, protein_ref, rtol=1e-7, atol=1e-9)
+
+
+def test_batch_simulate_matches_simulate():
+    simulators = [GeneticCircuitSimulator(CIRCUIT_ARRANGEMENTS['simple_operon'], parameters)
+                  for parameters in PARAMETER_SETS]
+    # With and without a zero-degradation circuit (stacked odeint vs broadcast closed form)
+    for batch in (simulators, [sim for sim in simulators if sim._rates[2] != 0]):
+        t, results = batch_simulate(batch)
+        for simulator, result in zip(batch, results):
+            _, mRNA, protein = simulator.simulate()
+            assert np.allclose(result['mRNA'], mRNA, rtol=1e-6, atol=1e-9)
+            assert np.allclose(result['protein'], protein, rtol=1e-6, atol=1e-9)
+
+
+
+def test_parallel_parameter_sweep_matches_serial():
+    arrangement = CIRCUIT_ARRANGEMENTS['simple_operon']
+    values = [1.0, 3.0, 5.0, 8.0]
+    serial = compare_parameter_effects(arrangement, 'promoter_strength', values)
+    parallel = compare_parameter_effects(arrangement, 'promoter_strength', values, processes=2)
+    for ax_serial, ax_parallel in zip(serial.axes, parallel.axes):
+        (curves_serial,), (curves_parallel,) = ax_serial.collections, ax_parallel.collections
+        assert len(curves_parallel.get_segments()) == len(values)
+        for a, b in zip(curves_serial.get_segments(), curves_parallel.get_segments()):
+            assert np.allclose(a, b, rtol=1e-9, atol=1e-12)
+    plt.close(serial)
+    plt.close(parallel)
+
+    # Mixed grids are solved per run, in-process or in the pool
+    jobs = [(arrangement, {'promoter_strength': 2.0}), (arrangement, {'time_points': 300})]
+    for (t1, m1, p1), (t2, m2, p2) in zip(simulate_many(jobs), simulate_many(jobs, processes=2)):
+        assert np.array_equal(t1, t2) and np.allclose(m1, m2) and np.allclose(p1, p2)